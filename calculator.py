@@ -1,8 +1,32 @@
 from __future__ import annotations
 
-from typing import List
+import sys
+from array import array
+from functools import singledispatch
+from operator import attrgetter, mul, truediv
+from typing import List, Sequence, Union
 
-from models import UserLog
+from models import MealType, UserLog, UserLogStore, _centi_calories_of
+
+_get_calories = attrgetter("calories")
+
+
+def _as_float(value: object, name: str) -> float:
+    """
+    Coerce a numeric value (or numeric string) to float.
+
+    Checks the common types explicitly so the usual case needs no exception
+    handling; other types (e.g. Decimal) still go through float().
+    Raises ValueError naming the offending argument for non-numeric input.
+    """
+    if isinstance(value, float):
+        return value
+    if isinstance(value, int):
+        return float(value)
+    try:
+        return float(value)
+    except (TypeError, ValueError):
+        raise ValueError(f"{name} must be numeric.") from None
 
 
 def calculate_calories_for_serving(
@@ -16,35 +40,121 @@ def calculate_calories_for_serving(
     Formula:
         Total = (Calories_per_serving / Standard_serving_size) * User_serving_size
 
+    Pure arithmetic for callers whose inputs are already numeric (e.g. values
+    from a FoodItem, which rejects a zero standard size at construction).
+    Use calculate_calories_for_serving_safe() for raw user input.
+    """
+    return (calories_per_serving / standard_serving_size) * user_serving_size
+
+
+def calculate_calories_for_serving_safe(
+    calories_per_serving: float,
+    standard_serving_size: float,
+    user_serving_size: float,
+) -> float:
+    """
+    Validating variant of calculate_calories_for_serving(), for values
+    typed into the GUI.
+
     All inputs are converted to float and validated.
     Raises:
-      - ValueError for non-numeric input
+      - ValueError naming the argument for non-numeric input
       - ZeroDivisionError if standard_serving_size == 0
     """
+    if (
+        type(calories_per_serving) is float
+        and type(standard_serving_size) is float
+        and type(user_serving_size) is float
+    ):
+        # Fast path: nothing to coerce, and float division by zero already
+        # raises ZeroDivisionError.
+        return calculate_calories_for_serving(
+            calories_per_serving, standard_serving_size, user_serving_size
+        )
+
+    cal = _as_float(calories_per_serving, "calories_per_serving")
+    std_size = _as_float(standard_serving_size, "standard_serving_size")
+    user_size = _as_float(user_serving_size, "user_serving_size")
+
+    if std_size == 0:
+        # Explicitly guard against division by zero
+        raise ZeroDivisionError("Standard serving size cannot be zero.")
+
+    return calculate_calories_for_serving(cal, std_size, user_size)
+
+
+def calculate_calories_for_serving_batch(
+    calories_per_serving: Sequence[float],
+    standard_serving_sizes: Sequence[float],
+    user_serving_sizes: Sequence[float],
+) -> List[float]:
+    """
+    Calculate total calories for many servings in one call.
+
+    Element i of the result equals calculate_calories_for_serving_safe()
+    applied to the i-th value of each input sequence.
+
+    Raises:
+      - ValueError if the sequences differ in length or hold non-numeric values
+      - ZeroDivisionError if any standard serving size is zero
+    """
     try:
-        cal = float(calories_per_serving)
-        std_size = float(standard_serving_size)
-        user_size = float(user_serving_size)
+        cals = list(map(float, calories_per_serving))
+        std_sizes = list(map(float, standard_serving_sizes))
+        user_sizes = list(map(float, user_serving_sizes))
     except (TypeError, ValueError):
         raise ValueError("All serving and calorie values must be numeric.")
 
-    if std_size == 0:
-        # Explicitly guard against division by zero
+    if not len(cals) == len(std_sizes) == len(user_sizes):
+        raise ValueError("Batch inputs must all have the same length.")
+
+    if 0.0 in std_sizes:
         raise ZeroDivisionError("Standard serving size cannot be zero.")
 
-    return (cal / std_size) * user_size
+    # Coercion and validation are done once per column above, so the
+    # arithmetic runs entirely inside map() with C-level operator callables.
+    return list(map(mul, map(truediv, cals, std_sizes), user_sizes))
 
 
-def total_daily_calories(logs: List[UserLog]) -> float:
+@singledispatch
+def total_daily_calories(logs: Union[List[UserLog], UserLogStore]) -> float:
     """
     Sum total calories from a list of user logs.
+
+    Each log's calories are quantized to integer centi-calories, as a
+    UserLogStore does on append, and summed exactly; the result is the same
+    for every container and long logs don't accumulate rounding error.
+
+    Dispatches on the container type: a UserLogStore is summed from its
+    contiguous calorie column, and an array of calorie values directly.
     """
-    return sum(log.calories for log in logs)
+    return sum(map(_centi_calories_of, map(_get_calories, logs))) / 100
 
 
-def filter_logs_by_meal_type(logs: List[UserLog], meal_type: str) -> List[UserLog]:
+@total_daily_calories.register(UserLogStore)
+def _total_store_calories(logs: UserLogStore) -> float:
+    return logs.total_calories()
+
+
+@total_daily_calories.register(array)
+def _total_array_calories(logs: array) -> float:
+    return sum(map(_centi_calories_of, logs)) / 100
+
+
+def filter_logs_by_meal_type(
+    logs: Union[List[UserLog], UserLogStore], meal_type: str
+) -> List[UserLog]:
     """
     Filter a list of logs by meal type (case-insensitive).
+
+    A UserLogStore answers from its meal-type index without scanning.
     """
-    meal_type_lower = meal_type.lower()
-    return [log for log in logs if log.meal_type.lower() == meal_type_lower]
\ No newline at end of file
+    if isinstance(logs, UserLogStore):
+        return logs.filter_by_meal_type(meal_type)
+    code = MealType.from_name(meal_type)
+    if code is not MealType.OTHER:
+        return [log for log in logs if log.meal_type_code == code]
+    # Free-form meal types share OTHER; UserLog interns its lowercase meal
+    # type, so identity is equality here.
+    target = sys.intern(meal_type.lower())
+    return [log for log in logs if log._meal_type_lower is target]
\ No newline at end of file
@@ -1,5 +1,7 @@
 from __future__ import annotations
 
+import logging
+
 from ui import run_app
 
 
@@ -10,6 +12,7 @@ def main() -> None:
     Keeps the code import-safe for future extensions (e.g., using CalQ
     logic in a web app) by only running the GUI when executed directly.
     """
+    logging.basicConfig(level=logging.INFO, format="%(levelname)s %(name)s: %(message)s")
     run_app()
 
 
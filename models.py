@@ -1,26 +1,92 @@
 from __future__ import annotations
 
+import sys
+import time
+from array import array
 from dataclasses import dataclass, field
 from datetime import datetime
-from typing import Optional
+from enum import IntEnum
+from typing import Dict, Iterable, Iterator, List, Optional, Sequence, Tuple
 
 
-@dataclass
+class MealType(IntEnum):
+    """
+    The fixed meal vocabulary used by the GUI, as small integer codes.
+    Any free-form meal type maps to OTHER.
+    """
+    BREAKFAST = 0
+    LUNCH = 1
+    DINNER = 2
+    SNACKS = 3
+    OTHER = 4
+
+    @classmethod
+    def from_name(cls, meal_type: str) -> MealType:
+        """Case-insensitive lookup by name; unknown names give OTHER."""
+        return cls.__members__.get(meal_type.upper(), cls.OTHER)
+
+    @property
+    def label(self) -> str:
+        """Display name, e.g. 'Breakfast'."""
+        return self.name.title()
+
+
+@dataclass(slots=True, frozen=True)
 class FoodItem:
     """
     Represents a single food item and its calorie information.
     This is a logical representation; the GUI/database can choose how to use it.
+    Instances are immutable and slotted, so they are hashable and compact.
     """
     name: str
     calories_per_serving: float
     standard_serving_size: float  # e.g., grams or ml
     unit: str = "g"               # default unit is grams
+    # calories_per_serving / standard_serving_size, folded once at construction
+    cal_per_unit: float = field(init=False, repr=False, compare=False)
 
+    def __post_init__(self) -> None:
+        # Validated once here so per-serving calculations can skip the check.
+        if self.standard_serving_size == 0:
+            raise ValueError("Standard serving size cannot be zero.")
+        object.__setattr__(
+            self,
+            "cal_per_unit",
+            self.calories_per_serving / self.standard_serving_size,
+        )
 
-@dataclass
+    def calories_for(self, user_serving_size: float) -> float:
+        """Total calories for a serving of `user_serving_size` units."""
+        return self.cal_per_unit * user_serving_size
+
+
+def _centi_calories_of(calories: float) -> int:
+    """Calories quantized to integer centi-calories, e.g. 123.456 -> 12346."""
+    return round(calories * 100)
+
+
+def _date_key_of(date: str) -> int:
+    """
+    'YYYY-MM-DD' -> int yyyymmdd key, e.g. '2025-01-17' -> 20250117.
+
+    Raises ValueError for anything not shaped like 'YYYY-MM-DD'.
+    """
+    digits = date[:4] + date[5:7] + date[8:]
+    if not (
+        len(date) == 10
+        and date[4] == date[7] == "-"
+        and digits.isascii()
+        and digits.isdigit()
+    ):
+        raise ValueError(f"date must be YYYY-MM-DD, got {date!r}")
+    return int(digits)
+
+
+@dataclass(slots=True)
 class UserLog:
     """
     Represents a user's logged meal item (a single entry in the log).
+    Kept mutable because `id` is assigned after the database insert.
     """
     id: Optional[int]  # database primary key, may be None before insert
     date: str          # stored as 'YYYY-MM-DD'
@@ -29,4 +95,174 @@ class UserLog:
     calories: float
     serving_size: str
     notes: Optional[str]
-    timestamp: datetime = field(default_factory=datetime.now)
\ No newline at end of file
+    timestamp: float = field(default_factory=time.time)  # seconds since the epoch
+    # lowercase copy of meal_type, refreshed by __setattr__ (including the
+    # assignment made in __init__) so filters don't re-lower it on every call.
+    # Both strings are interned, so filters can compare them by identity.
+    _meal_type_lower: str = field(init=False, repr=False, compare=False)
+    # meal_type normalized to a MealType code, so hot-path compares are ints.
+    meal_type_code: MealType = field(init=False, repr=False, compare=False)
+    # `date` parsed once into an int yyyymmdd key (e.g. 20250117) for cheap
+    # per-day comparisons and grouping; also refreshed by __setattr__.
+    _date_key: int = field(init=False, repr=False, compare=False)
+
+    def __setattr__(self, name: str, value) -> None:
+        if name == "meal_type":
+            value = self._set_meal_type_fields(value)
+        elif name == "date":
+            object.__setattr__(self, "_date_key", _date_key_of(value))
+        object.__setattr__(self, name, value)
+
+    def _set_meal_type_fields(self, meal_type: str) -> str:
+        """Set the fields derived from `meal_type`; return its interned copy."""
+        meal_type = sys.intern(meal_type)
+        object.__setattr__(self, "_meal_type_lower", sys.intern(meal_type.lower()))
+        object.__setattr__(self, "meal_type_code", MealType.from_name(meal_type))
+        return meal_type
+
+    @classmethod
+    def from_row(cls, row: Sequence) -> UserLog:
+        """
+        Build a UserLog from a database row, bypassing the keyword __init__.
+
+        `row` is (id, date, meal_type, food_name, calories, serving_size,
+        notes, timestamp) as returned by the meals table; an ISO-format
+        timestamp string is converted to epoch seconds.
+        """
+        id_, date, meal_type, food_name, calories, serving_size, notes, ts = row
+        if isinstance(ts, str):
+            ts = datetime.fromisoformat(ts).timestamp()
+
+        self = cls.__new__(cls)
+        setattr_ = object.__setattr__
+        setattr_(self, "id", id_)
+        setattr_(self, "date", date)
+        setattr_(self, "_date_key", _date_key_of(date))
+        setattr_(self, "meal_type", self._set_meal_type_fields(meal_type))
+        setattr_(self, "food_name", food_name)
+        setattr_(self, "calories", calories)
+        setattr_(self, "serving_size", serving_size)
+        setattr_(self, "notes", notes)
+        setattr_(self, "timestamp", ts)
+        return self
+
+    @property
+    def timestamp_dt(self) -> datetime:
+        """The log timestamp as a local datetime, converted on demand."""
+        return datetime.fromtimestamp(self.timestamp)
+
+
+class UserLogStore:
+    """
+    In-memory collection of UserLog entries.
+
+    Alongside the list of log objects, calories are kept in a contiguous
+    array (structure-of-arrays) of integer centi-calories (calories x 100,
+    quantized on append), so totals are exact integer sums instead of an
+    attribute lookup and float add per log. Parallel columns hold yyyymmdd
+    date keys (for per-day totals) and int8 MealType codes (for masks). A
+    lowercase meal_type -> indices index makes meal-type filtering
+    proportional to the number of matches.
+
+    Change a stored log's meal type through set_meal_type() so the index
+    stays correct.
+    """
+
+    def __init__(self, logs: Iterable[UserLog] = ()) -> None:
+        self._logs: List[UserLog] = []
+        self._centi_calories = array("q")
+        self._date_keys = array("l")
+        self._meal_codes = array("b")
+        self._by_meal: Dict[str, List[int]] = {}
+        for log in logs:
+            self.append(log)
+
+    def append(self, log: UserLog) -> None:
+        """Add a log entry, keeping the calorie column and index in sync."""
+        self._by_meal.setdefault(log._meal_type_lower, []).append(len(self._logs))
+        self._logs.append(log)
+        self._centi_calories.append(_centi_calories_of(log.calories))
+        self._date_keys.append(log._date_key)
+        self._meal_codes.append(log.meal_type_code)
+
+    def remove(self, index: int) -> UserLog:
+        """Remove and return the log at `index`."""
+        log = self._logs.pop(index)
+        del self._centi_calories[index]
+        del self._date_keys[index]
+        del self._meal_codes[index]
+        self._rebuild_meal_index()
+        return log
+
+    def set_meal_type(self, index: int, meal_type: str) -> None:
+        """Change the meal type of the log at `index` and patch the index."""
+        log = self._logs[index]
+        positions = self._by_meal[log._meal_type_lower]
+        positions.remove(index)
+        if not positions:
+            del self._by_meal[log._meal_type_lower]
+
+        log.meal_type = meal_type
+        self._meal_codes[index] = log.meal_type_code
+        positions = self._by_meal.setdefault(log._meal_type_lower, [])
+        positions.append(index)
+        positions.sort()
+
+    def daily_totals(self) -> Dict[str, float]:
+        """Total calories per date ('YYYY-MM-DD'), in one pass over the columns."""
+        totals: Dict[int, int] = {}
+        get = totals.get
+        for key, centi in zip(self._date_keys, self._centi_calories):
+            totals[key] = get(key, 0) + centi
+        return {
+            f"{key // 10000:04d}-{key // 100 % 100:02d}-{key % 100:02d}": total / 100
+            for key, total in sorted(totals.items())
+        }
+
+    def meal_breakdown(self) -> Tuple[float, Dict[str, float]]:
+        """
+        Return (total calories, calories per meal type) in a single pass.
+
+        The per-type dict is keyed by MealType labels ('Breakfast', ...,
+        'Other'; free-form meal types count towards 'Other').
+        """
+        totals = [0] * len(MealType)
+        grand = 0
+        for centi, code in zip(self._centi_calories, self._meal_codes):
+            totals[code] += centi
+            grand += centi
+        breakdown = {meal.label: totals[meal] / 100 for meal in MealType}
+        return grand / 100, breakdown
+
+    def filter_by_meal_type(self, meal_type: str) -> List[UserLog]:
+        """Return logs with the given meal type (case-insensitive), in order."""
+        logs = self._logs
+        return [logs[i] for i in self._by_meal.get(meal_type.lower(), ())]
+
+    def meal_type_mask(self, meal_type: str) -> List[bool]:
+        """One flag per stored log: True where it has the given meal type."""
+        code = MealType.from_name(meal_type)
+        if code is MealType.OTHER:
+            # Free-form meal types all share OTHER, so fall back to
+            # comparing the interned names.
+            target = sys.intern(meal_type.lower())
+            return [log._meal_type_lower is target for log in self._logs]
+        return list(map(int(code).__eq__, self._meal_codes))
+
+    def _rebuild_meal_index(self) -> None:
+        self._by_meal = {}
+        for i, log in enumerate(self._logs):
+            self._by_meal.setdefault(log._meal_type_lower, []).append(i)
+
+    def total_calories(self) -> float:
+        """Sum calories over every stored log, to the nearest centi-calorie."""
+        return sum(self._centi_calories) / 100
+
+    def __len__(self) -> int:
+        return len(self._logs)
+
+    def __iter__(self) -> Iterator[UserLog]:
+        return iter(self._logs)
+
+    def __getitem__(self, index: int) -> UserLog:
+        return self._logs[index]
\ No newline at end of file
@@ -0,0 +1,97 @@
+"""
+Tests for calculator.total_daily_calories across container types.
+
+Run with: python -m unittest
+"""
+
+import unittest
+from array import array
+
+from calculator import total_daily_calories
+from models import UserLog, UserLogStore
+
+
+def _logs(calories, count):
+    return [
+        UserLog(i, "2025-01-17", "Lunch", "food", calories, "", None)
+        for i in range(count)
+    ]
+
+
+class TotalDailyCaloriesTest(unittest.TestCase):
+    """A list, a UserLogStore and an array of the same values agree."""
+
+    def assert_paths_match(self, logs, expected):
+        self.assertEqual(total_daily_calories(logs), expected)
+        store = UserLogStore(logs)
+        self.assertEqual(total_daily_calories(store), expected)
+        self.assertEqual(
+            total_daily_calories(array("d", (log.calories for log in logs))),
+            expected,
+        )
+        grand, _ = store.meal_breakdown()
+        self.assertEqual(grand, expected)
+        self.assertEqual(store.daily_totals(), {"2025-01-17": expected})
+
+    def test_rounds_each_log_to_centi_calories(self):
+        self.assert_paths_match(_logs(0.333, 3), 0.99)
+
+    def test_rounds_half_centi_calories_to_even(self):
+        self.assert_paths_match(_logs(0.005, 100), 0.0)
+        self.assert_paths_match(_logs(0.015, 100), 2.0)
+
+    def test_no_float_drift(self):
+        self.assert_paths_match(_logs(0.1, 10), 1.0)
+
+    def test_mixed_values(self):
+        logs = _logs(0.1, 10) + _logs(1e6, 2) + _logs(123.456, 7)
+        self.assert_paths_match(logs, 2000865.22)
+
+    def test_empty(self):
+        self.assertEqual(total_daily_calories(UserLogStore()), 0.0)
+        self.assertEqual(total_daily_calories([]), 0.0)
+
+
+class MealBreakdownTest(unittest.TestCase):
+    """UserLogStore.meal_breakdown splits the grand total by meal type."""
+
+    def test_per_type_totals(self):
+        store = UserLogStore(
+            [
+                UserLog(1, "2025-01-17", "Breakfast", "oats", 150.25, "", None),
+                UserLog(2, "2025-01-17", "lunch", "soup", 300.0, "", None),
+                UserLog(3, "2025-01-18", "Breakfast", "eggs", 90.5, "", None),
+                UserLog(4, "2025-01-18", "Brunch", "waffle", 410.0, "", None),
+            ]
+        )
+        grand, breakdown = store.meal_breakdown()
+        self.assertEqual(grand, 950.75)
+        self.assertEqual(
+            breakdown,
+            {
+                "Breakfast": 240.75,
+                "Lunch": 300.0,
+                "Dinner": 0.0,
+                "Snacks": 0.0,
+                "Other": 410.0,
+            },
+        )
+        self.assertEqual(
+            store.daily_totals(), {"2025-01-17": 450.25, "2025-01-18": 500.5}
+        )
+
+
+class UserLogDateTest(unittest.TestCase):
+    """UserLog rejects dates it can't key by day, with a clear message."""
+
+    def test_malformed_dates(self):
+        for date in ("2025/01/17", "2025-1-17", "17-01-2025", ""):
+            with self.subTest(date=date):
+                with self.assertRaisesRegex(ValueError, "YYYY-MM-DD"):
+                    UserLog(1, date, "Lunch", "food", 1.0, "", None)
+                with self.assertRaisesRegex(ValueError, "YYYY-MM-DD"):
+                    UserLog.from_row((1, date, "Lunch", "food", 1.0, "", None, 0.0))
+
+
+if __name__ == "__main__":
+    unittest.main()
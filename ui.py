@@ -9,33 +9,264 @@ Contains:
 
 from __future__ import annotations
 
+import calendar
+import logging
 import sqlite3
+from collections import defaultdict
+from dataclasses import dataclass
 from datetime import datetime, timedelta
-from typing import List, Tuple, Optional
+from functools import lru_cache
+from itertools import groupby
+from math import fsum
+from operator import itemgetter
+from typing import Dict, Iterable, List, Tuple, Optional, Union
 
 import tkinter as tk
 from tkinter import ttk, messagebox, scrolledtext
+from tkinter import font as tkfont
 
 from models import UserLog
-# calculator is available if you want to plug in serving-size math:
-# from calculator import calculate_calories_for_serving
+# calculator is available if you want to plug in serving-size math; use the
+# validating variant for values typed into the form:
+# from calculator import calculate_calories_for_serving_safe
+
+
+logger = logging.getLogger(__name__)
+
+# Weekday abbreviations indexed by date.weekday()
+WEEKDAY_ABBRS = ("Mon", "Tue", "Wed", "Thu", "Fri", "Sat", "Sun")
+
+# Date sections built per step as the all logs view scrolls toward the end
+_LOG_SECTION_BATCH = 10
+# Meals read per query while paging through the history for that view
+_LOG_PAGE_SIZE = 100
+
+# Meal row geometry in the all logs view, and the row actions drawn from
+# the right edge inward as (action, label, colour)
+_LOG_ROW_MIN_HEIGHT = 56
+_LOG_ROW_GAP = 10
+_LOG_BUTTON_WIDTH = 100
+_LOG_ROW_ACTIONS = (
+    ("delete", "🗑️ Delete", "#f44336"),
+    ("edit", "✏️ Edit", "#2196f3"),
+)
+_LOG_ACTION_STYLES = {
+    action: (label, color) for action, label, color in _LOG_ROW_ACTIONS
+}
+# A clickable area on a rows canvas: ((x0, y0, x1, y1), meal id, action)
+_HitRegion = Tuple[Tuple[int, int, int, int], int, str]
+
+# Longest note kept in the one-line Entry before switching to a Text widget
+_NOTES_ENTRY_MAX_CHARS = 60
+
+# Meal types in display order, and the icon shown next to each
+_MEAL_TYPES = ("Breakfast", "Lunch", "Dinner", "Snacks")
+_MEAL_ICONS = {
+    "Breakfast": "🌅",
+    "Lunch": "🌞",
+    "Dinner": "🌙",
+    "Snacks": "🍿",
+}
+
+# All logs colours per meal type: row border, badge background, badge text
+_MEAL_COLORS = {
+    "Breakfast": "#ff9800",
+    "Lunch": "#4caf50",
+    "Dinner": "#2196f3",
+    "Snacks": "#9c27b0",
+}
+_BADGE_COLORS = {
+    "Breakfast": "#fff3e0",
+    "Lunch": "#e8f5e9",
+    "Dinner": "#e3f2fd",
+    "Snacks": "#f3e5f5",
+}
+_BADGE_TEXT_COLORS = {
+    "Breakfast": "#e65100",
+    "Lunch": "#1b5e20",
+    "Dinner": "#0d47a1",
+    "Snacks": "#4a148c",
+}
+
+
+# Connection settings applied on open: WAL journaling with synchronous=NORMAL
+# makes each commit a single WAL append instead of two fsyncs, and the rest
+# keep temp tables, recently used pages and a memory map in RAM.
+SQLITE_PRAGMAS = (
+    "PRAGMA journal_mode=WAL",
+    "PRAGMA synchronous=NORMAL",
+    "PRAGMA temp_store=MEMORY",
+    "PRAGMA mmap_size=134217728",
+    "PRAGMA cache_size=-20000",
+)
+
+# SQL used by DatabaseManager. Kept as module-level constants so every call
+# passes the identical string and hits sqlite3's per-connection statement
+# cache instead of re-preparing the query.
+SQL_INSERT_MEAL = """
+    INSERT INTO meals (date, meal_type, food_name, calories,
+                       serving_size, notes, timestamp)
+    VALUES (?, ?, ?, ?, ?, ?, ?)
+"""
+
+SQL_SELECT_MEAL = """
+    SELECT id, date, meal_type, food_name, calories,
+           serving_size, notes, timestamp
+    FROM meals
+    WHERE id = ?
+"""
+
+SQL_SELECT_MEALS_BY_DATE = """
+    SELECT id, meal_type, food_name, calories,
+           serving_size, notes, timestamp
+    FROM meals
+    WHERE date = ?
+    ORDER BY timestamp ASC
+"""
+
+# Newest first. The (date, timestamp, id) ordering is total, so a page can
+# resume right after the last row of the previous one (keyset pagination).
+# A LIMIT of -1 means no limit.
+SQL_SELECT_ALL_MEALS = """
+    SELECT id, date, meal_type, food_name, calories,
+           serving_size, notes, timestamp
+    FROM meals
+    ORDER BY date DESC, timestamp DESC, id DESC
+    LIMIT ?
+"""
+
+SQL_SELECT_MEALS_BEFORE = """
+    SELECT id, date, meal_type, food_name, calories,
+           serving_size, notes, timestamp
+    FROM meals
+    WHERE (date, timestamp, id) < (?, ?, ?)
+    ORDER BY date DESC, timestamp DESC, id DESC
+    LIMIT ?
+"""
+
+SQL_UPDATE_MEAL = """
+    UPDATE meals
+    SET meal_type = ?, food_name = ?, calories = ?,
+        serving_size = ?, notes = ?
+    WHERE id = ?
+"""
+
+SQL_DELETE_MEAL = "DELETE FROM meals WHERE id = ?"
+
+SQL_MEAL_TYPE_TOTALS_BY_DATE = """
+    SELECT meal_type, SUM(calories)
+    FROM meals
+    WHERE date = ?
+    GROUP BY meal_type
+"""
+
+SQL_DAILY_CALORIES = "SELECT SUM(calories) FROM meals WHERE date = ?"
+
+SQL_TARGET_CALORIES = "SELECT target_calories FROM users WHERE id = 1"
+
+SQL_DAILY_SUMMARY = """
+    SELECT (SELECT SUM(calories) FROM meals WHERE date = ?),
+           (SELECT target_calories FROM users WHERE id = 1)
+"""
+
+SQL_CALORIES_SINCE = """
+    SELECT date, SUM(calories)
+    FROM meals
+    WHERE date >= ?
+    GROUP BY date
+"""
+
+
+@lru_cache(maxsize=1024)
+def _parse_iso_date(date: str) -> datetime:
+    """Parse 'YYYY-MM-DD' into a datetime (memoized; raises ValueError)."""
+    # strptime alone also takes unpadded parts like '2025-1-5'
+    if len(date) != 10:
+        raise ValueError("expected YYYY-MM-DD, got %r" % date)
+    return datetime.strptime(date, "%Y-%m-%d")
+
+
+@lru_cache(maxsize=1024)
+def _format_log_date(date: str) -> str:
+    """Format 'YYYY-MM-DD' as e.g. 'Monday, January 05, 2026' (memoized)."""
+    parsed = _parse_iso_date(date)
+    return "%s, %s %02d, %d" % (
+        calendar.day_name[parsed.weekday()],
+        calendar.month_name[parsed.month],
+        parsed.day,
+        parsed.year,
+    )
+
+
+@dataclass(slots=True, frozen=True)
+class _MealColumns:
+    """One date's meals as parallel columns (struct of arrays), display order."""
+
+    ids: Tuple[int, ...]
+    meal_types: Tuple[str, ...]
+    food_names: Tuple[str, ...]
+    calories: Tuple[float, ...]
+    serving_sizes: Tuple[Optional[str], ...]
+    notes: Tuple[Optional[str], ...]
+
+    @classmethod
+    def from_rows(cls, rows: List[sqlite3.Row]) -> "_MealColumns":
+        """Transpose meal rows by column name; date and timestamp are dropped."""
+
+        def column(name: str) -> tuple:
+            return tuple(map(itemgetter(name), rows))
+
+        return cls(
+            column("id"),
+            column("meal_type"),
+            column("food_name"),
+            column("calories"),
+            column("serving_size"),
+            column("notes"),
+        )
+
+    def __len__(self) -> int:
+        return len(self.ids)
 
 
 class DatabaseManager:
     """Manages SQLite database operations for CalQ application."""
 
     def __init__(self, db_name: str = "calq_database.db") -> None:
-        """Initialize database connection and create tables if needed."""
+        """
+        Remember the database location; the connection is opened (and tables
+        created if needed) lazily by the first query, so constructing the
+        manager doesn't hold up the first paint of the window.
+        """
         self.db_name = db_name
         self.connection: Optional[sqlite3.Connection] = None
-        self.initialize_database()
+        # Target goal cached for the session; see invalidate_target_calories()
+        self._target_calories: Optional[int] = None
+
+    def _ensure_open(self) -> None:
+        """Open and initialize the database on first use."""
+        if self.connection is None:
+            self.initialize_database()
 
     def initialize_database(self) -> None:
         """Create database tables if they don't exist."""
         try:
-            self.connection = sqlite3.connect(self.db_name)
+            # Room for every distinct statement above, so none is evicted
+            # and re-prepared during a session. isolation_level=None turns
+            # off sqlite3's implicit transactions: single statements
+            # autocommit, and multi-statement work opens its own BEGIN.
+            self.connection = sqlite3.connect(
+                self.db_name, cached_statements=256, isolation_level=None
+            )
+            for pragma in SQLITE_PRAGMAS:
+                self.connection.execute(pragma)
+            # Rows support both positional and by-column-name access
+            self.connection.row_factory = sqlite3.Row
             cursor = self.connection.cursor()
 
+            # Schema setup and seeding share one journal cycle
+            cursor.execute("BEGIN IMMEDIATE")
+
             # Create meals table with all necessary fields
             cursor.execute(
                 """
@@ -52,6 +283,13 @@ class DatabaseManager:
                 """
             )
 
+            # Date lookups (daily totals, weekly overview) seek this index,
+            # and its timestamp column serves read_meals_by_date's ORDER BY
+            # without a sort step.
+            cursor.execute(
+                "CREATE INDEX IF NOT EXISTS idx_meals_date_ts ON meals(date, timestamp)"
+            )
+
             # Create users table for settings
             cursor.execute(
                 """
@@ -71,11 +309,12 @@ class DatabaseManager:
                     ("User", 2000),
                 )
 
-            self.connection.commit()
-            print("Database initialized successfully!")
+            cursor.execute("COMMIT")
+            logger.info("Database initialized successfully!")
 
         except sqlite3.Error as error:
-            print(f"Database error: {error}")
+            self._rollback()
+            logger.error("Database error: %s", error)
             messagebox.showerror(
                 "Database Error", f"Failed to initialize database: {error}"
             )
@@ -90,60 +329,89 @@ class DatabaseManager:
         notes: str = "",
     ) -> bool:
         """CREATE operation - Add a new meal entry."""
+        return self.create_meals(
+            [(date, meal_type, food_name, calories, serving_size, notes)]
+        )
+
+    def create_meals(self, rows: Iterable[Tuple]) -> bool:
+        """
+        CREATE operation - Add meal entries in a single transaction.
+
+        Each row is (date, meal_type, food_name, calories, serving_size, notes);
+        all rows share one timestamp and one journal commit, so bulk imports
+        don't pay an fsync per row.
+        """
         try:
-            cursor = self.connection.cursor()
             timestamp = datetime.now().isoformat()
-
-            cursor.execute(
-                """
-                INSERT INTO meals (date, meal_type, food_name, calories,
-                                   serving_size, notes, timestamp)
-                VALUES (?, ?, ?, ?, ?, ?, ?)
-                """,
-                (date, meal_type, food_name, calories, serving_size, notes, timestamp),
+            self._ensure_open()
+            cursor = self.connection.cursor()
+            cursor.execute("BEGIN IMMEDIATE")
+            cursor.executemany(
+                SQL_INSERT_MEAL, (tuple(row) + (timestamp,) for row in rows)
             )
-
-            self.connection.commit()
+            cursor.execute("COMMIT")
             return True
         except sqlite3.Error as error:
-            print(f"Error creating meal: {error}")
+            self._rollback()
+            logger.error("Error creating meal: %s", error)
             messagebox.showerror("Error", f"Failed to create meal entry: {error}")
             return False
 
-    def read_meals_by_date(self, date: str) -> List[Tuple]:
+    def read_meal(self, meal_id: int) -> Optional[sqlite3.Row]:
+        """READ operation - Get a single meal by id (None if it doesn't exist)."""
+        try:
+            self._ensure_open()
+            return self.connection.execute(SQL_SELECT_MEAL, (meal_id,)).fetchone()
+        except sqlite3.Error as error:
+            logger.error("Error reading meal: %s", error)
+            return None
+
+    def read_meals_by_date(self, date: str) -> List[sqlite3.Row]:
         """READ operation - Get all meals for a specific date."""
         try:
-            cursor = self.connection.cursor()
-            cursor.execute(
-                """
-                SELECT id, meal_type, food_name, calories,
-                       serving_size, notes, timestamp
-                FROM meals
-                WHERE date = ?
-                ORDER BY timestamp ASC
-                """,
-                (date,),
-            )
-            return cursor.fetchall()
+            self._ensure_open()
+            return self.connection.execute(SQL_SELECT_MEALS_BY_DATE, (date,)).fetchall()
         except sqlite3.Error as error:
-            print(f"Error reading meals: {error}")
+            logger.error("Error reading meals: %s", error)
             return []
 
-    def read_all_meals(self) -> List[Tuple]:
-        """READ operation - Get all meals from database."""
+    def read_meals_and_totals_by_date(
+        self, date: str
+    ) -> Tuple[List[sqlite3.Row], Dict[str, float]]:
+        """READ operation - Get a date's meals plus calorie totals per meal type."""
         try:
-            cursor = self.connection.cursor()
-            cursor.execute(
-                """
-                SELECT id, date, meal_type, food_name, calories,
-                       serving_size, notes, timestamp
-                FROM meals
-                ORDER BY date DESC, timestamp DESC
-                """
-            )
+            self._ensure_open()
+            execute = self.connection.execute
+            meals = execute(SQL_SELECT_MEALS_BY_DATE, (date,)).fetchall()
+            return meals, dict(execute(SQL_MEAL_TYPE_TOTALS_BY_DATE, (date,)))
+        except sqlite3.Error as error:
+            logger.error("Error reading meals: %s", error)
+            return [], {}
+
+    def read_all_meals(
+        self,
+        limit: Optional[int] = 100,
+        before: Optional[Tuple[str, str, int]] = None,
+    ) -> List[sqlite3.Row]:
+        """
+        READ operation - Get meals from database, newest first.
+
+        Returns at most `limit` rows (all of them if `limit` is None). Pass the
+        (date, timestamp, id) of the last row already shown as `before` to get
+        the next page.
+        """
+        page_size = -1 if limit is None else limit
+        try:
+            self._ensure_open()
+            if before is None:
+                cursor = self.connection.execute(SQL_SELECT_ALL_MEALS, (page_size,))
+            else:
+                cursor = self.connection.execute(
+                    SQL_SELECT_MEALS_BEFORE, (*before, page_size)
+                )
             return cursor.fetchall()
         except sqlite3.Error as error:
-            print(f"Error reading all meals: {error}")
+            logger.error("Error reading all meals: %s", error)
             return []
 
     def update_meal(
@@ -157,67 +425,100 @@ class DatabaseManager:
     ) -> bool:
         """UPDATE operation - Modify an existing meal entry."""
         try:
-            cursor = self.connection.cursor()
-            cursor.execute(
-                """
-                UPDATE meals
-                SET meal_type = ?, food_name = ?, calories = ?,
-                    serving_size = ?, notes = ?
-                WHERE id = ?
-                """,
+            self._ensure_open()
+            self.connection.execute(
+                SQL_UPDATE_MEAL,
                 (meal_type, food_name, calories, serving_size, notes, meal_id),
             )
-
-            self.connection.commit()
             return True
         except sqlite3.Error as error:
-            print(f"Error updating meal: {error}")
+            logger.error("Error updating meal: %s", error)
             messagebox.showerror("Error", f"Failed to update meal: {error}")
             return False
 
     def delete_meal(self, meal_id: int) -> bool:
         """DELETE operation - Remove a meal entry."""
         try:
-            cursor = self.connection.cursor()
-            cursor.execute("DELETE FROM meals WHERE id = ?", (meal_id,))
-            self.connection.commit()
+            self._ensure_open()
+            self.connection.execute(SQL_DELETE_MEAL, (meal_id,))
             return True
         except sqlite3.Error as error:
-            print(f"Error deleting meal: {error}")
+            logger.error("Error deleting meal: %s", error)
             messagebox.showerror("Error", f"Failed to delete meal: {error}")
             return False
 
     def get_daily_calories(self, date: str) -> float:
         """Calculate total calories for a specific date."""
         try:
-            cursor = self.connection.cursor()
-            cursor.execute("SELECT SUM(calories) FROM meals WHERE date = ?", (date,))
-            result = cursor.fetchone()[0]
+            self._ensure_open()
+            result = self.connection.execute(SQL_DAILY_CALORIES, (date,)).fetchone()[0]
             return float(result) if result else 0.0
         except sqlite3.Error as error:
-            print(f"Error calculating calories: {error}")
+            logger.error("Error calculating calories: %s", error)
             return 0.0
 
-    def get_weekly_data(self) -> List[Tuple[str, float]]:
-        """Get calorie data for the last 7 days."""
-        weekly_data: List[Tuple[str, float]] = []
-        for i in range(6, -1, -1):
-            date = (datetime.now() - timedelta(days=i)).strftime("%Y-%m-%d")
-            calories = self.get_daily_calories(date)
-            weekly_data.append((date, calories))
-        return weekly_data
+    def get_weekly_data(self) -> List[Tuple[str, float, int]]:
+        """
+        Get calorie data for the last 7 days, oldest first.
+
+        Each entry is (date 'YYYY-MM-DD', calories, weekday) where weekday is
+        date.weekday() (Monday == 0), so callers need not re-parse the date.
+        """
+        today = datetime.now().date()
+        days = [today - timedelta(days=i) for i in range(6, -1, -1)]
+        dates = [day.isoformat() for day in days]
+        try:
+            self._ensure_open()
+            totals = dict(self.connection.execute(SQL_CALORIES_SINCE, (dates[0],)))
+        except sqlite3.Error as error:
+            logger.error("Error reading weekly calories: %s", error)
+            totals = {}
+        return [
+            (date, float(totals.get(date) or 0.0), day.weekday())
+            for date, day in zip(dates, days)
+        ]
 
     def get_target_calories(self) -> int:
-        """Get user's target calorie goal."""
+        """Get user's target calorie goal (cached after the first read)."""
+        if self._target_calories is not None:
+            return self._target_calories
         try:
-            cursor = self.connection.cursor()
-            cursor.execute("SELECT target_calories FROM users WHERE id = 1")
-            result = cursor.fetchone()
-            return int(result[0]) if result else 2000
+            self._ensure_open()
+            result = self.connection.execute(SQL_TARGET_CALORIES).fetchone()
+            self._target_calories = int(result[0]) if result else 2000
+            return self._target_calories
         except sqlite3.Error as error:
-            print(f"Error getting target calories: {error}")
+            logger.error("Error getting target calories: %s", error)
             return 2000
 
+    def invalidate_target_calories(self) -> None:
+        """Drop the cached target goal; call after changing it in the database."""
+        self._target_calories = None
+
+    def _rollback(self) -> None:
+        """Roll back an explicit transaction left open by a failed statement."""
+        if self.connection and self.connection.in_transaction:
+            self.connection.rollback()
+
+    def get_summary(self, date: str) -> Tuple[float, int]:
+        """
+        Get (total calories for `date`, target calorie goal) in one query.
+
+        Once the target is cached only the daily total is queried.
+        """
+        if self._target_calories is not None:
+            return self.get_daily_calories(date), self._target_calories
+        try:
+            self._ensure_open()
+            daily, target = self.connection.execute(
+                SQL_DAILY_SUMMARY, (date,)
+            ).fetchone()
+            self._target_calories = int(target) if target is not None else 2000
+            return float(daily) if daily else 0.0, self._target_calories
+        except sqlite3.Error as error:
+            logger.error("Error getting daily summary: %s", error)
+            return 0.0, 2000
+
     def close(self) -> None:
         """Close database connection."""
         if self.connection:
@@ -227,6 +528,18 @@ class DatabaseManager:
 class CalQApp:
     """Main application class for CalQ Food & Calorie Tracker."""
 
+    # Shared options for the three navigation buttons in the header (the
+    # font is added per button; a Font can't be built before the Tk root)
+    _NAV_BTN_STYLE = {
+        "bd": 0,
+        "padx": 25,
+        "pady": 12,
+        "cursor": "hand2",
+        "relief": "flat",
+        "activebackground": "#2196f3",
+        "activeforeground": "white",
+    }
+
     def __init__(self, root: tk.Tk) -> None:
         """Initialize the application."""
         self.root = root
@@ -234,12 +547,42 @@ class CalQApp:
         self.root.geometry("1100x750")
         self.root.configure(bg="#f5f7fa")
 
+        # "Segoe UI" fonts by (size, style), created for this root on first
+        # use by _font() and reused by every widget after that
+        self._fonts: Dict[Tuple[int, str], tkfont.Font] = {}
+
         # Initialize database
         self.db = DatabaseManager()
 
         # Application state
         self.selected_date: str = datetime.now().strftime("%Y-%m-%d")
         self.editing_meal_id: Optional[int] = None
+        # Meals paged in for the logs view so far, grouped by date (newest
+        # first); None until first read or after any write (see
+        # _get_meal_groups / _invalidate_meals_cache). The last date of a
+        # page may continue on the next one, so its rows wait in _meals_tail.
+        self._meals_cache: Optional[List[Tuple[str, _MealColumns]]] = None
+        self._meals_tail: List[sqlite3.Row] = []
+        self._meals_cursor: Optional[Tuple[str, str, int]] = None
+        self._meals_exhausted: bool = False
+        # Pending after() id for the throttled dashboard canvas resize
+        self._resize_after_id: Optional[str] = None
+
+        # All logs view: how many cached date groups have sections so far,
+        # and the pending after_idle() id for building the next batch
+        self._log_rendered: int = 0
+        self._log_render_after_id: Optional[str] = None
+        self._log_frame: tk.Frame
+        # Meals drawn on, and clickable row actions of, each rows canvas,
+        # keyed by widget path so the canvases can share bound-method handlers
+        self._log_row_meals: Dict[str, _MealColumns] = {}
+        self._log_hit_regions: Dict[str, List[_HitRegion]] = {}
+        # (top, bottom, meal id) per row, and the (canvas, meal id) whose
+        # actions are currently drawn
+        self._log_row_spans: Dict[str, List[Tuple[int, int, int]]] = {}
+        # Width each rows canvas was last drawn at
+        self._log_row_widths: Dict[str, int] = {}
+        self._log_hovered: Optional[Tuple[str, int]] = None
 
         # Placeholders for some widgets (to avoid type checker noise)
         self.main_container: tk.Frame
@@ -248,18 +591,57 @@ class CalQApp:
         self.btn_all_logs: tk.Button
         self.date_entry: tk.Entry
 
+        # Dashboard widgets that refresh_dashboard() updates in place
+        self._lbl_daily_cal: tk.Label
+        self._lbl_target: tk.Label
+        self._lbl_percentage: tk.Label
+        self._progress_bar: tk.Frame
+        self._lbl_progress: tk.Label
+        self._lbl_status: tk.Label
+        self._meals_body: tk.Frame
+        self._meals_tree: ttk.Treeview
+        self._meals_toolbar: tk.Frame
+        self._meals_empty: tk.Frame
+        self._weekly_canvas: tk.Canvas
+        # Canvas item ids per day: (bar, highlight, day label bg, day, calories)
+        self._weekly_bars: List[Tuple[int, int, int, int, int]]
+
         # Form entries in add/edit view
         self.entry_date: tk.Entry
         self.entry_meal_type: ttk.Combobox
         self.entry_food_name: tk.Entry
         self.entry_calories: tk.Entry
         self.entry_serving_size: tk.Entry
-        self.entry_notes: scrolledtext.ScrolledText
+        # A one-line Entry until the note grows (see _expand_notes_field)
+        self.entry_notes: Union[tk.Entry, scrolledtext.ScrolledText]
+        # Add/edit form, built on first use and reused afterwards
+        self._form_frame: Optional[tk.Frame] = None
+        self._form_title: tk.Label
+        self._form_canvas: tk.Canvas
+        self._form_submit: tk.Button
+        self._form_secondary: tk.Button
+        # Values of the meal being edited, as loaded into the form
+        self._loaded_meal: Optional[Dict[str, object]] = None
 
         # Create GUI
         self.create_header()
         self.create_main_container()
-        self.show_dashboard()
+        # The dashboard is the first thing that queries (and so opens) the
+        # database; deferring it lets the header and navigation show first.
+        self.root.after_idle(self.show_dashboard)
+
+    def _font(self, size: int, style: str = "") -> tkfont.Font:
+        """Return this app's "Segoe UI" font of `size`, optionally "bold"/"italic"."""
+        font = self._fonts.get((size, style))
+        if font is None:
+            font = self._fonts[(size, style)] = tkfont.Font(
+                root=self.root,
+                family="Segoe UI",
+                size=size,
+                weight="bold" if style == "bold" else "normal",
+                slant="italic" if style == "italic" else "roman",
+            )
+        return font
 
     # ------------------------------------------------------------------ Header
 
@@ -279,7 +661,7 @@ class CalQApp:
         title_label = tk.Label(
             title_frame,
             text="🍽️ CalQ",
-            font=("Segoe UI", 32, "bold"),
+            font=self._font(32, "bold"),
             bg="#1976d2",
             fg="white",
         )
@@ -288,7 +670,7 @@ class CalQApp:
         subtitle_label = tk.Label(
             title_frame,
             text="Daily Food & Calorie Tracker",
-            font=("Segoe UI", 13),
+            font=self._font(13),
             bg="#1976d2",
             fg="#bbdefb",
         )
@@ -301,7 +683,7 @@ class CalQApp:
         sdg_label = tk.Label(
             sdg_frame,
             text="  SDG 3: Good Health & Well-Being  \n  Promoting Healthy Eating Habits  ",
-            font=("Segoe UI", 11, "bold"),
+            font=self._font(11, "bold"),
             bg="#0d47a1",
             fg="#ffffff",
             justify="center",
@@ -318,24 +700,14 @@ class CalQApp:
         shadow_frame = tk.Frame(self.root, bg="#e0e0e0", height=2)
         shadow_frame.pack(fill="x")
 
-        btn_style = {
-            "font": ("Segoe UI", 12, "bold"),
-            "bd": 0,
-            "padx": 25,
-            "pady": 12,
-            "cursor": "hand2",
-            "relief": "flat",
-            "activebackground": "#2196f3",
-            "activeforeground": "white",
-        }
-
         self.btn_dashboard = tk.Button(
             nav_frame,
             text="📊 Dashboard",
             command=self.show_dashboard,
             bg="#2196f3",
             fg="white",
-            **btn_style,
+            font=self._font(12, "bold"),
+            **CalQApp._NAV_BTN_STYLE,
         )
         self.btn_dashboard.pack(side="left", padx=8, pady=10)
 
@@ -345,7 +717,8 @@ class CalQApp:
             command=self.show_add_meal,
             bg="#f5f5f5",
             fg="#424242",
-            **btn_style,
+            font=self._font(12, "bold"),
+            **CalQApp._NAV_BTN_STYLE,
         )
         self.btn_add_meal.pack(side="left", padx=8, pady=10)
 
@@ -355,7 +728,8 @@ class CalQApp:
             command=self.show_all_logs,
             bg="#f5f5f5",
             fg="#424242",
-            **btn_style,
+            font=self._font(12, "bold"),
+            **CalQApp._NAV_BTN_STYLE,
         )
         self.btn_all_logs.pack(side="left", padx=8, pady=10)
 
@@ -366,10 +740,43 @@ class CalQApp:
         self.main_container = tk.Frame(self.root, bg="#f5f7fa")
         self.main_container.pack(fill="both", expand=True, padx=0, pady=0)
 
+    def _bind_scrollregion(self, canvas: tk.Canvas, frame: tk.Frame) -> None:
+        """
+        Keep `canvas`'s scrollregion fitted to `frame`, its only window item.
+
+        A burst of <Configure> events (e.g. while many sections are packed
+        or the window is resized) updates the scrollregion once, at idle,
+        from the frame's last reported size instead of walking bbox("all").
+        """
+        size = [0, 0]
+        pending: List[str] = []
+
+        def apply() -> None:
+            pending.clear()
+            if canvas.winfo_exists():
+                canvas.configure(scrollregion=(0, 0, size[0], size[1]))
+
+        def on_configure(event: tk.Event) -> None:
+            size[0], size[1] = event.width, event.height
+            if not pending:
+                pending.append(canvas.after_idle(apply))
+
+        frame.bind("<Configure>", on_configure)
+
     def clear_main_container(self) -> None:
         """Clear all widgets from main container."""
+        if self._resize_after_id is not None:
+            self.root.after_cancel(self._resize_after_id)
+            self._resize_after_id = None
+        if self._log_render_after_id is not None:
+            self.root.after_cancel(self._log_render_after_id)
+            self._log_render_after_id = None
         for widget in self.main_container.winfo_children():
-            widget.destroy()
+            if widget is self._form_frame:
+                # Kept for reuse by show_add_meal()
+                widget.pack_forget()
+            else:
+                widget.destroy()
 
     def update_nav_buttons(self, active_button: str) -> None:
         """Update navigation button styles."""
@@ -387,6 +794,19 @@ class CalQApp:
 
     # -------------------------------------------------------------- Dashboard
 
+    def _schedule_resize(self, canvas: tk.Canvas, window_id: int, width: int) -> None:
+        """Coalesce a burst of <Configure> events into one resize per ~16 ms."""
+        if self._resize_after_id is not None:
+            self.root.after_cancel(self._resize_after_id)
+        self._resize_after_id = self.root.after(
+            16, self._apply_resize, canvas, window_id, width
+        )
+
+    def _apply_resize(self, canvas: tk.Canvas, window_id: int, width: int) -> None:
+        """Stretch the scrollable frame to the canvas width."""
+        self._resize_after_id = None
+        canvas.itemconfig(window_id, width=width)
+
     def show_dashboard(self) -> None:
         """Display main dashboard view."""
         self.clear_main_container()
@@ -399,15 +819,12 @@ class CalQApp:
         )
         scrollable_frame = tk.Frame(canvas, bg="#f5f7fa")
 
-        scrollable_frame.bind(
-            "<Configure>",
-            lambda event: canvas.configure(scrollregion=canvas.bbox("all")),
-        )
+        self._bind_scrollregion(canvas, scrollable_frame)
 
         window_id = canvas.create_window((0, 0), window=scrollable_frame, anchor="nw")
         canvas.bind(
             "<Configure>",
-            lambda event: canvas.itemconfig(window_id, width=event.width),
+            lambda event: self._schedule_resize(canvas, window_id, event.width),
         )
         canvas.configure(yscrollcommand=scrollbar.set)
 
@@ -420,10 +837,12 @@ class CalQApp:
         right_col = tk.Frame(content_wrapper, bg="#f5f7fa", width=420)
         right_col.pack(side="right", fill="y", padx=(10, 20))
 
+        daily_calories, target_calories = self.db.get_summary(self.selected_date)
+
         self.create_date_selector(left_col)
-        self.create_daily_summary(left_col)
+        self.create_daily_summary(left_col, daily_calories, target_calories)
         self.create_meals_breakdown(left_col)
-        self.create_weekly_chart(right_col)
+        self.create_weekly_chart(right_col, target_calories)
 
         canvas.pack(side="left", fill="both", expand=True)
         scrollbar.pack(side="right", fill="y")
@@ -442,14 +861,14 @@ class CalQApp:
         tk.Label(
             content_frame,
             text="📅 Select Date:",
-            font=("Segoe UI", 12, "bold"),
+            font=self._font(12, "bold"),
             bg="white",
             fg="#424242",
         ).pack(side="left", padx=10)
 
         self.date_entry = tk.Entry(
             content_frame,
-            font=("Segoe UI", 12),
+            font=self._font(12),
             width=18,
             relief="solid",
             bd=1,
@@ -466,7 +885,7 @@ class CalQApp:
             command=self.update_selected_date,
             bg="#2196f3",
             fg="white",
-            font=("Segoe UI", 11, "bold"),
+            font=self._font(11, "bold"),
             cursor="hand2",
             padx=20,
             pady=6,
@@ -479,7 +898,7 @@ class CalQApp:
         tk.Label(
             content_frame,
             text="(Format: YYYY-MM-DD)",
-            font=("Segoe UI", 10),
+            font=self._font(10),
             bg="white",
             fg="#9e9e9e",
         ).pack(side="left", padx=15)
@@ -487,16 +906,30 @@ class CalQApp:
     def update_selected_date(self) -> None:
         """Update selected date and refresh dashboard."""
         try:
-            date_str = self.date_entry.get()
-            datetime.strptime(date_str, "%Y-%m-%d")
+            date_str = self.date_entry.get().strip()
+            _parse_iso_date(date_str)
             self.selected_date = date_str
-            self.show_dashboard()
+            self.refresh_dashboard()
         except ValueError:
             messagebox.showerror(
                 "Invalid Date", "Please enter date in YYYY-MM-DD format"
             )
 
-    def create_daily_summary(self, parent: tk.Frame) -> None:
+    def refresh_dashboard(self) -> None:
+        """
+        Re-query dashboard data and update the existing widgets in place.
+
+        Only valid while the dashboard built by show_dashboard() is on screen;
+        the widget tree is kept and only texts, colours and geometry change.
+        """
+        daily_calories, target_calories = self.db.get_summary(self.selected_date)
+        self.update_daily_summary(daily_calories, target_calories)
+        self.populate_meals_breakdown()
+        self.update_weekly_chart(target_calories)
+
+    def create_daily_summary(
+        self, parent: tk.Frame, daily_calories: float, target_calories: int
+    ) -> None:
         """Create daily calorie summary card with gradient design."""
         frame = tk.Frame(parent, bg="white", relief="flat", bd=0)
         frame.pack(fill="x", padx=20, pady=15)
@@ -507,14 +940,10 @@ class CalQApp:
         shadow = tk.Frame(frame, bg="#e0e0e0", height=2)
         shadow.pack(side="bottom", fill="x")
 
-        daily_calories = self.db.get_daily_calories(self.selected_date)
-        target_calories = self.db.get_target_calories()
-        percentage = (daily_calories / target_calories * 100) if target_calories > 0 else 0
-
         tk.Label(
             gradient_frame,
             text="📈 Today's Calorie Summary",
-            font=("Segoe UI", 18, "bold"),
+            font=self._font(18, "bold"),
             bg="#4caf50",
             fg="white",
         ).pack(anchor="w", padx=25, pady=(20, 10))
@@ -522,49 +951,68 @@ class CalQApp:
         calories_frame = tk.Frame(gradient_frame, bg="#4caf50")
         calories_frame.pack(fill="x", padx=25, pady=10)
 
-        tk.Label(
+        self._lbl_daily_cal = tk.Label(
             calories_frame,
-            text=f"{int(daily_calories)}",
-            font=("Segoe UI", 48, "bold"),
+            font=self._font(48, "bold"),
             bg="#4caf50",
             fg="white",
-        ).pack(side="left")
+        )
+        self._lbl_daily_cal.pack(side="left")
 
         details_frame = tk.Frame(calories_frame, bg="#4caf50")
         details_frame.pack(side="left", padx=15)
 
-        tk.Label(
+        self._lbl_target = tk.Label(
             details_frame,
-            text=f"of {target_calories} calories",
-            font=("Segoe UI", 14),
+            font=self._font(14),
             bg="#4caf50",
             fg="#e8f5e9",
-        ).pack(anchor="w")
+        )
+        self._lbl_target.pack(anchor="w")
 
-        tk.Label(
+        self._lbl_percentage = tk.Label(
             details_frame,
-            text=f"{int(percentage)}% of daily goal",
-            font=("Segoe UI", 12),
+            font=self._font(12),
             bg="#4caf50",
             fg="#c8e6c9",
-        ).pack(anchor="w")
+        )
+        self._lbl_percentage.pack(anchor="w")
 
         progress_container = tk.Frame(gradient_frame, bg="#81c784", height=30)
         progress_container.pack(fill="x", padx=25, pady=(10, 5))
         progress_container.pack_propagate(False)
 
-        progress_width = min(percentage, 100)
-        progress_bar = tk.Frame(progress_container, bg="white", height=30)
-        progress_bar.place(x=0, y=0, relwidth=progress_width / 100, relheight=1)
+        self._progress_bar = tk.Frame(progress_container, bg="white", height=30)
+        self._progress_bar.place(x=0, y=0, relwidth=0, relheight=1)
 
-        progress_label = tk.Label(
+        self._lbl_progress = tk.Label(
             progress_container,
-            text=f"{int(percentage)}%",
-            font=("Segoe UI", 11, "bold"),
+            font=self._font(11, "bold"),
             bg="#81c784",
             fg="white",
         )
-        progress_label.place(relx=0.5, rely=0.5, anchor="center")
+        self._lbl_progress.place(relx=0.5, rely=0.5, anchor="center")
+
+        self._lbl_status = tk.Label(
+            gradient_frame,
+            font=self._font(11, "bold"),
+            bg="#4caf50",
+        )
+        self._lbl_status.pack(anchor="w", padx=25, pady=(5, 20))
+
+        self.update_daily_summary(daily_calories, target_calories)
+
+    def update_daily_summary(self, daily_calories: float, target_calories: int) -> None:
+        """Write calorie figures into the summary card's existing widgets."""
+        percentage = (daily_calories / target_calories * 100) if target_calories > 0 else 0
+
+        self._lbl_daily_cal.config(text=f"{int(daily_calories)}")
+        self._lbl_target.config(text=f"of {target_calories} calories")
+        self._lbl_percentage.config(text=f"{int(percentage)}% of daily goal")
+
+        progress_width = min(percentage, 100)
+        self._progress_bar.place_configure(relwidth=progress_width / 100)
+        self._lbl_progress.config(text=f"{int(percentage)}%")
 
         if percentage > 100:
             status_text = f"⚠️ {int(percentage - 100)}% over target"
@@ -576,15 +1024,9 @@ class CalQApp:
             status_text = f"💪 {int(100 - percentage)}% remaining - Keep going!"
             status_color = "#c8e6c9"
 
-        tk.Label(
-            gradient_frame,
-            text=status_text,
-            font=("Segoe UI", 11, "bold"),
-            bg="#4caf50",
-            fg=status_color,
-        ).pack(anchor="w", padx=25, pady=(5, 20))
+        self._lbl_status.config(text=status_text, fg=status_color)
 
-    def create_weekly_chart(self, parent: tk.Frame) -> None:
+    def create_weekly_chart(self, parent: tk.Frame, target_calories: int) -> None:
         """Create weekly calorie chart with modern design."""
         frame = tk.Frame(parent, bg="white", relief="flat", bd=0)
         frame.pack(fill="both", expand=True, padx=10, pady=15)
@@ -595,11 +1037,55 @@ class CalQApp:
         tk.Label(
             frame,
             text="📊 Weekly Overview",
-            font=("Segoe UI", 16, "bold"),
+            font=self._font(16, "bold"),
             bg="white",
             fg="#424242",
         ).pack(anchor="w", padx=20, pady=(15, 10))
 
+        bar_width = 60
+        spacing = 20
+        chart_height = 220
+        bar_area = chart_height - 60
+
+        # The whole chart is drawn on one canvas; each day is a handful of
+        # canvas items rather than a tree of frames and labels.
+        self._weekly_canvas = tk.Canvas(
+            frame,
+            bg="white",
+            width=7 * (bar_width + spacing),
+            height=chart_height,
+            highlightthickness=0,
+        )
+        self._weekly_canvas.pack(fill="both", expand=True, padx=10, pady=10)
+        canvas = self._weekly_canvas
+
+        self._weekly_bars = []
+        for i in range(7):
+            x0 = i * (bar_width + spacing)
+            x1 = x0 + bar_width
+            canvas.create_rectangle(x0, 0, x1, bar_area, fill="#f5f5f5", width=0)
+            bar = canvas.create_rectangle(x0, bar_area, x1, bar_area, width=0)
+            highlight = canvas.create_rectangle(
+                x0, bar_area, x1, bar_area, fill="#1976d2", width=0, state="hidden"
+            )
+            day_bg = canvas.create_rectangle(
+                x0 + 10, bar_area + 8, x1 - 10, bar_area + 30, width=0
+            )
+            day_text = canvas.create_text(
+                (x0 + x1) / 2, bar_area + 19, font=self._font(10, "bold")
+            )
+            cal_text = canvas.create_text(
+                (x0 + x1) / 2,
+                bar_area + 42,
+                font=self._font(9),
+                fill="#757575",
+            )
+            self._weekly_bars.append((bar, highlight, day_bg, day_text, cal_text))
+
+        self.update_weekly_chart(target_calories)
+
+    def update_weekly_chart(self, target_calories: int) -> None:
+        """Re-query the last 7 days and move/restyle the existing chart items."""
         try:
             weekly_data = self.db.get_weekly_data()
         except Exception:
@@ -607,64 +1093,36 @@ class CalQApp:
 
         max_calories = 1
         if weekly_data:
-            max_calories = max(
-                [cal for _, cal in weekly_data] + [self.db.get_target_calories()]
-            )
-
-        chart_frame = tk.Frame(frame, bg="white")
-        chart_frame.pack(fill="both", expand=True, padx=10, pady=10)
-        chart_frame.update_idletasks()
+            max_calories = max(target_calories, *map(itemgetter(1), weekly_data))
 
-        bar_width = 60
-        spacing = 20
         chart_height = 220
+        bar_area = chart_height - 60
+        canvas = self._weekly_canvas
 
-        for date, calories in weekly_data:
-            bar_frame = tk.Frame(
-                chart_frame, bg="white", width=bar_width, height=chart_height
-            )
-            bar_frame.pack(side="left", padx=(0, spacing), pady=0)
-            bar_frame.pack_propagate(False)
-
-            bar_container = tk.Frame(bar_frame, bg="#f5f5f5", height=chart_height - 60)
-            bar_container.pack(fill="x", expand=True)
-            bar_container.pack_propagate(False)
-
+        for items, (date, calories, weekday) in zip(self._weekly_bars, weekly_data):
+            bar, highlight, day_bg, day_text, cal_text = items
             bar_height = (
-                int(calories / max_calories * (chart_height - 60))
-                if max_calories > 0
-                else 0
+                int(calories / max_calories * bar_area) if max_calories > 0 else 0
+            )
+            is_selected = date == self.selected_date
+            x0, _, x1, _ = canvas.coords(bar)
+            top = bar_area - bar_height
+
+            canvas.coords(bar, x0, top, x1, bar_area)
+            canvas.itemconfig(bar, fill="#2196f3" if is_selected else "#64b5f6")
+            canvas.coords(highlight, x0, top, x1, min(top + 4, bar_area))
+            canvas.itemconfig(
+                highlight, state="normal" if is_selected and bar_height else "hidden"
             )
-            bar_color = "#2196f3" if date == self.selected_date else "#64b5f6"
-
-            bar = tk.Frame(bar_container, bg=bar_color)
-            bar.place(x=0, rely=1, relwidth=1, height=bar_height, anchor="sw")
-
-            if date == self.selected_date:
-                highlight = tk.Frame(bar, bg="#1976d2", height=4)
-                highlight.pack(side="top", fill="x")
-
-            day_name = datetime.strptime(date, "%Y-%m-%d").strftime("%a")
-            label_bg = "#2196f3" if date == self.selected_date else "white"
-            label_fg = "white" if date == self.selected_date else "#424242"
 
-            tk.Label(
-                bar_frame,
+            day_name = WEEKDAY_ABBRS[weekday]
+            canvas.itemconfig(day_bg, fill="#2196f3" if is_selected else "white")
+            canvas.itemconfig(
+                day_text,
                 text=day_name,
-                font=("Segoe UI", 10, "bold"),
-                bg=label_bg,
-                fg=label_fg,
-                padx=5,
-                pady=3,
-            ).pack(pady=(8, 2))
-
-            tk.Label(
-                bar_frame,
-                text=f"{int(calories)} cal",
-                font=("Segoe UI", 9),
-                bg="white",
-                fg="#757575",
-            ).pack()
+                fill="white" if is_selected else "#424242",
+            )
+            canvas.itemconfig(cal_text, text=f"{int(calories)} cal")
 
     def create_meals_breakdown(self, parent: tk.Frame) -> None:
         """Create today's meals breakdown with modern cards."""
@@ -680,7 +1138,7 @@ class CalQApp:
         tk.Label(
             header_frame,
             text="🍴 Today's Meals",
-            font=("Segoe UI", 16, "bold"),
+            font=self._font(16, "bold"),
             bg="white",
             fg="#424242",
         ).pack(side="left")
@@ -691,7 +1149,7 @@ class CalQApp:
             command=self.show_add_meal,
             bg="#4caf50",
             fg="white",
-            font=("Segoe UI", 11, "bold"),
+            font=self._font(11, "bold"),
             cursor="hand2",
             padx=20,
             pady=8,
@@ -701,181 +1159,179 @@ class CalQApp:
             activeforeground="white",
         ).pack(side="right")
 
-        meals = self.db.read_meals_by_date(self.selected_date)
-
-        if not meals:
-            empty_frame = tk.Frame(frame, bg="#f5f5f5")
-            empty_frame.pack(fill="x", padx=20, pady=30)
-
-            tk.Label(empty_frame, text="🍽️", font=("Segoe UI", 48), bg="#f5f5f5").pack(
-                pady=10
-            )
-
-            tk.Label(
-                empty_frame,
-                text="No meals logged yet today",
-                font=("Segoe UI", 14),
-                bg="#f5f5f5",
-                fg="#9e9e9e",
-            ).pack()
-
-            tk.Label(
-                empty_frame,
-                text="Start tracking your nutrition by adding your first meal!",
-                font=("Segoe UI", 11),
-                bg="#f5f5f5",
-                fg="#bdbdbd",
-            ).pack(pady=(5, 20))
-        else:
-            meal_types = ["Breakfast", "Lunch", "Dinner", "Snacks"]
-            meal_icons = {
-                "Breakfast": "🌅",
-                "Lunch": "🌞",
-                "Dinner": "🌙",
-                "Snacks": "🍿",
-            }
-
-            for meal_type in meal_types:
-                type_meals = [meal for meal in meals if meal[1] == meal_type]
-                if type_meals:
-                    self.create_meal_type_section(
-                        frame, meal_type, type_meals, meal_icons.get(meal_type, "🍴")
-                    )
-
-    def create_meal_type_section(
-        self,
-        parent: tk.Frame,
-        meal_type: str,
-        meals: List[Tuple],
-        icon: str,
-    ) -> None:
-        """Create section for specific meal type with modern design."""
-        section_frame = tk.Frame(parent, bg="#fafafa", relief="flat", bd=0)
-        section_frame.pack(fill="x", padx=20, pady=8)
-
-        total_calories = sum(meal[3] for meal in meals)
-
-        header = tk.Frame(section_frame, bg="#fafafa")
-        header.pack(fill="x", padx=15, pady=12)
-
-        title_frame = tk.Frame(header, bg="#fafafa")
-        title_frame.pack(side="left")
-
-        tk.Label(
-            title_frame,
-            text=f"{icon} {meal_type}",
-            font=("Segoe UI", 14, "bold"),
-            bg="#fafafa",
-            fg="#424242",
-        ).pack(side="left")
-
-        tk.Label(
-            title_frame,
-            text=f"  •  {len(meals)} item{'s' if len(meals) > 1 else ''}",
-            font=("Segoe UI", 11),
-            bg="#fafafa",
-            fg="#9e9e9e",
-        ).pack(side="left")
-
-        cal_label = tk.Label(
-            header,
-            text=f"{int(total_calories)} cal",
-            font=("Segoe UI", 14, "bold"),
-            bg="#fafafa",
-            fg="#4caf50",
+        # Date-dependent content: a Treeview for the meals (one native widget
+        # instead of a frame tree per row) and an empty-state card. A refresh
+        # only swaps rows and toggles which of the two is packed.
+        style = ttk.Style(self.root)
+        style.configure(
+            "Meals.Treeview", font=self._font(11), rowheight=32, borderwidth=0
         )
-        cal_label.pack(side="right")
+        style.configure("Meals.Treeview.Heading", font=self._font(10, "bold"))
 
-        for meal in meals:
-            self.create_meal_item(section_frame, meal)
+        self._meals_body = tk.Frame(frame, bg="white")
+        self._meals_body.pack(fill="both", expand=True, padx=20, pady=(0, 15))
 
-    def create_meal_item(self, parent: tk.Frame, meal: Tuple) -> None:
-        """Create individual meal item with modern card design."""
-        meal_id, meal_type, food_name, calories, serving_size, notes, timestamp = meal
-
-        item_frame = tk.Frame(parent, bg="white", relief="flat", bd=0)
-        item_frame.pack(fill="x", padx=15, pady=4)
-
-        border = tk.Frame(item_frame, bg="#2196f3", width=4)
-        border.pack(side="left", fill="y")
-
-        content_frame = tk.Frame(item_frame, bg="white")
-        content_frame.pack(side="left", fill="both", expand=True, padx=15, pady=12)
-
-        tk.Label(
-            content_frame,
-            text=food_name,
-            font=("Segoe UI", 12, "bold"),
-            bg="white",
-            fg="#212121",
-            anchor="w",
-        ).pack(fill="x")
-
-        if serving_size:
-            tk.Label(
-                content_frame,
-                text=f"📏 {serving_size}",
-                font=("Segoe UI", 10),
-                bg="white",
-                fg="#757575",
-                anchor="w",
-            ).pack(fill="x", pady=(2, 0))
-
-        if notes:
-            tk.Label(
-                content_frame,
-                text=f"💭 {notes}",
-                font=("Segoe UI", 10, "italic"),
-                bg="white",
-                fg="#9e9e9e",
-                anchor="w",
-            ).pack(fill="x", pady=(2, 0))
-
-        actions_frame = tk.Frame(item_frame, bg="white")
-        actions_frame.pack(side="right", padx=15, pady=12)
-
-        cal_frame = tk.Frame(actions_frame, bg="#e8f5e9", padx=12, pady=6)
-        cal_frame.pack(side="left", padx=(0, 10))
+        tree = ttk.Treeview(
+            self._meals_body,
+            columns=("serving", "notes", "cal"),
+            show="tree headings",
+            selectmode="browse",
+            style="Meals.Treeview",
+        )
+        tree.heading("#0", text="Meal", anchor="w")
+        tree.heading("serving", text="Serving", anchor="w")
+        tree.heading("notes", text="Notes", anchor="w")
+        tree.heading("cal", text="Calories", anchor="e")
+        tree.column("#0", width=240, stretch=True)
+        tree.column("serving", width=110, stretch=False)
+        tree.column("notes", width=180, stretch=True)
+        tree.column("cal", width=90, stretch=False, anchor="e")
+        tree.tag_configure(
+            "meal_type", font=self._font(12, "bold"), background="#fafafa"
+        )
+        tree.bind("<Double-1>", lambda event: self.edit_selected_meal())
+        tree.bind("<Delete>", lambda event: self.delete_selected_meal())
+        self._meals_tree = tree
 
-        tk.Label(
-            cal_frame,
-            text=f"{int(calories)} cal",
-            font=("Segoe UI", 12, "bold"),
-            bg="#e8f5e9",
-            fg="#2e7d32",
-        ).pack()
+        toolbar = tk.Frame(self._meals_body, bg="white")
+        toolbar.pack(side="bottom", fill="x", pady=(8, 0))
+        self._meals_toolbar = toolbar
 
         tk.Button(
-            actions_frame,
-            text="✏️ Edit",
-            command=lambda: self.edit_meal(meal_id),
-            bg="#2196f3",
+            toolbar,
+            text="🗑️ Delete",
+            command=self.delete_selected_meal,
+            bg="#f44336",
             fg="white",
-            font=("Segoe UI", 10, "bold"),
+            font=self._font(10, "bold"),
             cursor="hand2",
             padx=12,
             pady=5,
             relief="flat",
             bd=0,
-            activebackground="#1976d2",
+            activebackground="#d32f2f",
             activeforeground="white",
-        ).pack(side="left", padx=3)
+        ).pack(side="right", padx=3)
 
         tk.Button(
-            actions_frame,
-            text="🗑️ Delete",
-            command=lambda: self.delete_meal_confirm(meal_id),
-            bg="#f44336",
+            toolbar,
+            text="✏️ Edit",
+            command=self.edit_selected_meal,
+            bg="#2196f3",
             fg="white",
-            font=("Segoe UI", 10, "bold"),
+            font=self._font(10, "bold"),
             cursor="hand2",
             padx=12,
             pady=5,
             relief="flat",
             bd=0,
-            activebackground="#d32f2f",
+            activebackground="#1976d2",
             activeforeground="white",
-        ).pack(side="left", padx=3)
+        ).pack(side="right", padx=3)
+
+        empty_frame = tk.Frame(self._meals_body, bg="#f5f5f5")
+        self._meals_empty = empty_frame
+
+        tk.Label(empty_frame, text="🍽️", font=self._font(48), bg="#f5f5f5").pack(
+            pady=10
+        )
+
+        tk.Label(
+            empty_frame,
+            text="No meals logged yet today",
+            font=self._font(14),
+            bg="#f5f5f5",
+            fg="#9e9e9e",
+        ).pack()
+
+        tk.Label(
+            empty_frame,
+            text="Start tracking your nutrition by adding your first meal!",
+            font=self._font(11),
+            bg="#f5f5f5",
+            fg="#bdbdbd",
+        ).pack(pady=(5, 20))
+
+        self.populate_meals_breakdown()
+
+    def populate_meals_breakdown(self) -> None:
+        """Reload the meals tree for the selected date."""
+        tree = self._meals_tree
+        tree.delete(*tree.get_children())
+
+        meals, totals = self.db.read_meals_and_totals_by_date(self.selected_date)
+
+        if not meals:
+            tree.pack_forget()
+            self._meals_toolbar.pack_forget()
+            self._meals_empty.pack(fill="x", pady=15)
+            return
+
+        self._meals_empty.pack_forget()
+        self._meals_toolbar.pack(side="bottom", fill="x", pady=(8, 0))
+        tree.pack(fill="both", expand=True)
+
+        # One pass to bucket the meals instead of a scan per meal type
+        buckets: Dict[str, List[sqlite3.Row]] = defaultdict(list)
+        for meal in meals:
+            buckets[meal["meal_type"]].append(meal)
+
+        rows = 0
+        for meal_type in _MEAL_TYPES:
+            type_meals = buckets.get(meal_type)
+            if not type_meals:
+                continue
+            count = len(type_meals)
+            # Parent iids are prefixed so they never collide with meal ids
+            parent = tree.insert(
+                "",
+                "end",
+                iid="type:" + meal_type,
+                text=("%s %s  •  %d items" if count > 1 else "%s %s  •  %d item")
+                % (_MEAL_ICONS.get(meal_type, "🍴"), meal_type, count),
+                values=("", "", "%d cal" % totals.get(meal_type, 0.0)),
+                open=True,
+                tags=("meal_type",),
+            )
+            for meal in type_meals:
+                tree.insert(
+                    parent,
+                    "end",
+                    iid=str(meal["id"]),
+                    text=meal["food_name"],
+                    values=(
+                        meal["serving_size"] or "",
+                        meal["notes"] or "",
+                        "%d cal" % meal["calories"],
+                    ),
+                )
+            rows += count + 1
+
+        # The dashboard canvas does the scrolling, so show every row
+        tree.configure(height=rows)
+
+    def _selected_meal_id(self) -> Optional[int]:
+        """Return the id of the meal selected in the tree, if any."""
+        selection = self._meals_tree.selection()
+        if not selection or selection[0].startswith("type:"):
+            return None
+        return int(selection[0])
+
+    def edit_selected_meal(self) -> None:
+        """Edit the meal selected in the tree."""
+        meal_id = self._selected_meal_id()
+        if meal_id is None:
+            messagebox.showinfo("Edit Meal", "Select a meal to edit.")
+            return
+        self.edit_meal(meal_id)
+
+    def delete_selected_meal(self) -> None:
+        """Delete the meal selected in the tree."""
+        meal_id = self._selected_meal_id()
+        if meal_id is None:
+            messagebox.showinfo("Delete Meal", "Select a meal to delete.")
+            return
+        self.delete_meal_confirm(meal_id)
 
     # ------------------------------------------------------------ Add/Edit view
 
@@ -883,9 +1339,44 @@ class CalQApp:
         """Display add meal form with modern design."""
         self.clear_main_container()
         self.update_nav_buttons("add_meal")
+        self._loaded_meal = None
+
+        # The form is built once and re-packed on later visits; only its
+        # title, buttons and field contents change between add and edit.
+        if self._form_frame is None:
+            self._build_meal_form()
+        self._form_frame.pack(fill="both", expand=True)
+        self._form_canvas.yview_moveto(0)
+
+        if self.editing_meal_id:
+            self._form_title.configure(text="✏️ Edit Meal Entry")
+            self._form_submit.configure(
+                text="✓ Update Meal",
+                command=self.update_meal_submit,
+                bg="#2196f3",
+                activebackground="#1976d2",
+            )
+            self._form_secondary.configure(text="✕ Cancel", command=self.cancel_edit)
+        else:
+            self._form_title.configure(text="➕ Log New Meal")
+            self._form_submit.configure(
+                text="✓ Log Meal",
+                command=self.create_meal_submit,
+                bg="#4caf50",
+                activebackground="#388e3c",
+            )
+            self._form_secondary.configure(
+                text="← Back", command=self.show_dashboard
+            )
 
+        self._reset_form()
+        if self.editing_meal_id:
+            self.load_meal_data()
+
+    def _build_meal_form(self) -> None:
+        """Create the add/edit form widgets (once per app)."""
         outer_frame = tk.Frame(self.main_container, bg="#f5f7fa")
-        outer_frame.pack(fill="both", expand=True)
+        self._form_frame = outer_frame
 
         form_frame = tk.Frame(outer_frame, bg="white", relief="flat", bd=0)
         form_frame.place(relx=0.5, rely=0.5, anchor="center", relwidth=0.72, relheight=0.85)
@@ -893,27 +1384,25 @@ class CalQApp:
         shadow = tk.Frame(form_frame, bg="#e0e0e0", height=2)
         shadow.pack(side="bottom", fill="x")
 
-        title_text = "✏️ Edit Meal Entry" if self.editing_meal_id else "➕ Log New Meal"
         title_frame = tk.Frame(form_frame, bg="#2196f3")
         title_frame.pack(fill="x")
 
-        tk.Label(
+        self._form_title = tk.Label(
             title_frame,
-            text=title_text,
-            font=("Segoe UI", 20, "bold"),
+            font=self._font(20, "bold"),
             bg="#2196f3",
             fg="white",
             pady=20,
-        ).pack()
+        )
+        self._form_title.pack()
 
         canvas = tk.Canvas(form_frame, bg="white", highlightthickness=0, height=450)
         scrollbar = ttk.Scrollbar(form_frame, orient="vertical", command=canvas.yview)
-        fields_frame = tk.Frame(canvas, bg="white")
+        # The frame's own padding insets the fields; no extra pad frame
+        fields_frame = tk.Frame(canvas, bg="white", padx=40, pady=20)
+        self._form_canvas = canvas
 
-        fields_frame.bind(
-            "<Configure>",
-            lambda event: canvas.configure(scrollregion=canvas.bbox("all")),
-        )
+        self._bind_scrollregion(canvas, fields_frame)
 
         window_id_fields = canvas.create_window((0, 0), window=fields_frame, anchor="nw")
         canvas.bind(
@@ -922,21 +1411,18 @@ class CalQApp:
         )
         canvas.configure(yscrollcommand=scrollbar.set)
 
-        inner_fields = tk.Frame(fields_frame, bg="white")
-        inner_fields.pack(fill="both", expand=True, padx=40, pady=20)
-
-        self.create_form_field(inner_fields, "Date", 0, is_date=True, required=True)
+        self.create_form_field(fields_frame, "Date", 0, required=True)
         self.create_form_field(
-            inner_fields,
+            fields_frame,
             "Meal Type",
             1,
-            options=["Breakfast", "Lunch", "Dinner", "Snacks"],
+            options=list(_MEAL_TYPES),
             required=True,
         )
-        self.create_form_field(inner_fields, "Food Name", 2, required=True)
-        self.create_form_field(inner_fields, "Calories", 3, required=True)
-        self.create_form_field(inner_fields, "Serving Size", 4)
-        self.create_form_field(inner_fields, "Notes", 5, multiline=True)
+        self.create_form_field(fields_frame, "Food Name", 2, required=True)
+        self.create_form_field(fields_frame, "Calories", 3, required=True)
+        self.create_form_field(fields_frame, "Serving Size", 4)
+        self.create_form_field(fields_frame, "Notes", 5, multiline=True)
 
         canvas.pack(side="left", fill="both", expand=True)
         scrollbar.pack(side="right", fill="y")
@@ -944,72 +1430,44 @@ class CalQApp:
         btn_frame = tk.Frame(form_frame, bg="white")
         btn_frame.pack(fill="x", pady=20)
 
-        if self.editing_meal_id:
-            self.load_meal_data()
+        self._form_submit = tk.Button(
+            btn_frame,
+            fg="white",
+            font=self._font(13, "bold"),
+            cursor="hand2",
+            width=18,
+            pady=12,
+            relief="flat",
+            bd=0,
+            activeforeground="white",
+        )
+        self._form_submit.pack(side="left", padx=(150, 10))
 
-            tk.Button(
-                btn_frame,
-                text="✓ Update Meal",
-                command=self.update_meal_submit,
-                bg="#2196f3",
-                fg="white",
-                font=("Segoe UI", 13, "bold"),
-                cursor="hand2",
-                width=18,
-                pady=12,
-                relief="flat",
-                bd=0,
-                activebackground="#1976d2",
-                activeforeground="white",
-            ).pack(side="left", padx=(150, 10))
-
-            tk.Button(
-                btn_frame,
-                text="✕ Cancel",
-                command=self.cancel_edit,
-                bg="#757575",
-                fg="white",
-                font=("Segoe UI", 13, "bold"),
-                cursor="hand2",
-                width=12,
-                pady=12,
-                relief="flat",
-                bd=0,
-                activebackground="#616161",
-                activeforeground="white",
-            ).pack(side="left", padx=10)
-        else:
-            tk.Button(
-                btn_frame,
-                text="✓ Log Meal",
-                command=self.create_meal_submit,
-                bg="#4caf50",
-                fg="white",
-                font=("Segoe UI", 13, "bold"),
-                cursor="hand2",
-                width=18,
-                pady=12,
-                relief="flat",
-                bd=0,
-                activebackground="#388e3c",
-                activeforeground="white",
-            ).pack(side="left", padx=(150, 10))
-
-            tk.Button(
-                btn_frame,
-                text="← Back",
-                command=self.show_dashboard,
-                bg="#757575",
-                fg="white",
-                font=("Segoe UI", 13, "bold"),
-                cursor="hand2",
-                width=12,
-                pady=12,
-                relief="flat",
-                bd=0,
-                activebackground="#616161",
-                activeforeground="white",
-            ).pack(side="left", padx=10)
+        self._form_secondary = tk.Button(
+            btn_frame,
+            bg="#757575",
+            fg="white",
+            font=self._font(13, "bold"),
+            cursor="hand2",
+            width=12,
+            pady=12,
+            relief="flat",
+            bd=0,
+            activebackground="#616161",
+            activeforeground="white",
+        )
+        self._form_secondary.pack(side="left", padx=10)
+
+    def _reset_form(self) -> None:
+        """Clear the form; a new entry defaults to the selected date."""
+        self.entry_date.delete(0, "end")
+        if not self.editing_meal_id:
+            self.entry_date.insert(0, self.selected_date)
+        self.entry_meal_type.current(0)
+        self.entry_food_name.delete(0, "end")
+        self.entry_calories.delete(0, "end")
+        self.entry_serving_size.delete(0, "end")
+        self._set_notes("")
 
     def create_form_field(
         self,
@@ -1017,7 +1475,6 @@ class CalQApp:
         label: str,
         row: int,
         required: bool = False,
-        is_date: bool = False,
         options: Optional[List[str]] = None,
         multiline: bool = False,
     ) -> None:
@@ -1032,28 +1489,30 @@ class CalQApp:
         tk.Label(
             field_frame,
             text=label_text,
-            font=("Segoe UI", 11, "bold"),
+            font=self._font(11, "bold"),
             bg="white",
             fg="#424242",
             anchor="w",
         ).pack(fill="x", pady=(0, 6))
 
         if multiline:
-            widget: tk.Widget = scrolledtext.ScrolledText(
+            # Most notes are short: start with an Entry and only build the
+            # Text + Scrollbar pair once the note outgrows it.
+            widget: tk.Widget = tk.Entry(
                 field_frame,
-                font=("Segoe UI", 11),
-                height=4,
-                wrap="word",
+                font=self._font(11),
                 relief="solid",
                 bd=1,
                 highlightthickness=1,
                 highlightcolor="#2196f3",
                 highlightbackground="#e0e0e0",
             )
+            widget.bind("<KeyRelease>", self._on_notes_key)
+            widget.bind("<Return>", self._on_notes_return)
         elif options:
             combo = ttk.Combobox(
                 field_frame,
-                font=("Segoe UI", 11),
+                font=self._font(11),
                 values=options,
                 state="readonly",
             )
@@ -1062,7 +1521,7 @@ class CalQApp:
         else:
             widget = tk.Entry(
                 field_frame,
-                font=("Segoe UI", 11),
+                font=self._font(11),
                 relief="solid",
                 bd=1,
                 highlightthickness=1,
@@ -1075,47 +1534,114 @@ class CalQApp:
         field_name = label.lower().replace(" ", "_")
         setattr(self, f"entry_{field_name}", widget)
 
-        if is_date and not self.editing_meal_id and isinstance(widget, tk.Entry):
-            widget.insert(0, self.selected_date)
-
     def load_meal_data(self) -> None:
         """Load meal data for editing."""
-        meals = self.db.read_all_meals()
-        meal_data = next(
-            (meal for meal in meals if meal[0] == self.editing_meal_id), None
-        )
+        meal_data = self.db.read_meal(self.editing_meal_id)
 
         if meal_data is None:
             return
 
-        _, date, meal_type, food_name, calories, serving_size, notes, _ = meal_data
-
         self.entry_date.delete(0, "end")
-        self.entry_date.insert(0, date)
+        self.entry_date.insert(0, meal_data["date"])
 
-        self.entry_meal_type.set(meal_type)
+        self.entry_meal_type.set(meal_data["meal_type"])
 
         self.entry_food_name.delete(0, "end")
-        self.entry_food_name.insert(0, food_name)
+        self.entry_food_name.insert(0, meal_data["food_name"])
 
         self.entry_calories.delete(0, "end")
-        self.entry_calories.insert(0, str(calories))
+        self.entry_calories.insert(0, str(meal_data["calories"]))
 
         self.entry_serving_size.delete(0, "end")
-        self.entry_serving_size.insert(0, serving_size or "")
+        self.entry_serving_size.insert(0, meal_data["serving_size"] or "")
+
+        self._set_notes(meal_data["notes"] or "")
 
-        self.entry_notes.delete("1.0", "end")
-        self.entry_notes.insert("1.0", notes or "")
+        self._loaded_meal = {
+            "meal_type": meal_data["meal_type"],
+            "food_name": meal_data["food_name"],
+            "calories": meal_data["calories"],
+            "serving_size": meal_data["serving_size"] or "",
+            "notes": meal_data["notes"] or "",
+        }
+
+    def _on_notes_key(self, event: tk.Event) -> None:
+        """Swap the notes Entry for a Text once the note gets long."""
+        if len(event.widget.get()) > _NOTES_ENTRY_MAX_CHARS:
+            self._expand_notes_field()
+
+    def _on_notes_return(self, event: tk.Event) -> str:
+        """Start a new line: an Entry can't hold one, so expand first."""
+        self._expand_notes_field()
+        self.entry_notes.insert("insert", "\n")
+        return "break"
+
+    def _expand_notes_field(self) -> None:
+        """Replace the notes Entry with a ScrolledText, keeping its content."""
+        entry = self.entry_notes
+        if not isinstance(entry, tk.Entry):
+            return
+        text = scrolledtext.ScrolledText(
+            entry.master,
+            font=self._font(11),
+            height=4,
+            wrap="word",
+            relief="solid",
+            bd=1,
+            highlightthickness=1,
+            highlightcolor="#2196f3",
+            highlightbackground="#e0e0e0",
+        )
+        text.insert("1.0", entry.get())
+        # Keep the caret where the user was typing, not at the end
+        text.mark_set("insert", "1.0 + %d chars" % entry.index("insert"))
+        had_focus = self.root.focus_get() is entry
+        entry.destroy()
+        text.pack(fill="x", ipady=8)
+        if had_focus:
+            text.focus_set()
+        self.entry_notes = text
+
+    def _set_notes(self, notes: str) -> None:
+        """Load `notes` into the notes field, expanding it if needed."""
+        if len(notes) > _NOTES_ENTRY_MAX_CHARS or "\n" in notes:
+            self._expand_notes_field()
+        widget = self.entry_notes
+        if isinstance(widget, tk.Entry):
+            widget.delete(0, "end")
+            widget.insert(0, notes)
+        else:
+            widget.delete("1.0", "end")
+            widget.insert("1.0", notes)
+            # Only read the notes back on submit if the user edits them
+            widget.edit_modified(False)
+
+    def _get_form_values(self) -> Dict[str, str]:
+        """Read the add/edit form fields, stripped of surrounding whitespace."""
+        widget = self.entry_notes
+        if isinstance(widget, tk.Entry):
+            notes = widget.get().strip()
+        elif widget.edit_modified():
+            notes = widget.get("1.0", "end").strip()
+        elif self._loaded_meal is not None:
+            notes = str(self._loaded_meal["notes"])
+        else:
+            notes = ""
+        return {
+            "date": self.entry_date.get().strip(),
+            "meal_type": self.entry_meal_type.get(),
+            "food_name": self.entry_food_name.get().strip(),
+            "calories": self.entry_calories.get().strip(),
+            "serving_size": self.entry_serving_size.get().strip(),
+            "notes": notes,
+        }
 
     def create_meal_submit(self) -> None:
         """Handle meal creation form submission."""
         try:
-            date = self.entry_date.get().strip()
-            meal_type = self.entry_meal_type.get()
-            food_name = self.entry_food_name.get().strip()
-            calories_str = self.entry_calories.get().strip()
-            serving_size = self.entry_serving_size.get().strip()
-            notes = self.entry_notes.get("1.0", "end").strip()
+            values = self._get_form_values()
+            food_name = values["food_name"]
+            calories_str = values["calories"]
 
             if not food_name or not calories_str:
                 messagebox.showerror(
@@ -1134,8 +1660,14 @@ class CalQApp:
                 return
 
             if self.db.create_meal(
-                date, meal_type, food_name, calories, serving_size, notes
+                values["date"],
+                values["meal_type"],
+                food_name,
+                calories,
+                values["serving_size"],
+                values["notes"],
             ):
+                self._invalidate_meals_cache()
                 messagebox.showinfo("Success", "✓ Meal logged successfully!")
                 self.show_dashboard()
 
@@ -1145,11 +1677,12 @@ class CalQApp:
     def update_meal_submit(self) -> None:
         """Handle meal update form submission."""
         try:
-            meal_type = self.entry_meal_type.get()
-            food_name = self.entry_food_name.get().strip()
-            calories_str = self.entry_calories.get().strip()
-            serving_size = self.entry_serving_size.get().strip()
-            notes = self.entry_notes.get("1.0", "end").strip()
+            values = self._get_form_values()
+            meal_type = values["meal_type"]
+            food_name = values["food_name"]
+            calories_str = values["calories"]
+            serving_size = values["serving_size"]
+            notes = values["notes"]
 
             if not food_name or not calories_str:
                 messagebox.showerror(
@@ -1167,9 +1700,23 @@ class CalQApp:
                 )
                 return
 
+            submitted = {
+                "meal_type": meal_type,
+                "food_name": food_name,
+                "calories": calories,
+                "serving_size": serving_size,
+                "notes": notes,
+            }
+            if submitted == self._loaded_meal:
+                # Nothing to write; just leave the form
+                self.editing_meal_id = None
+                self.show_dashboard()
+                return
+
             if self.db.update_meal(
                 self.editing_meal_id, meal_type, food_name, calories, serving_size, notes
             ):
+                self._invalidate_meals_cache()
                 messagebox.showinfo("Success", "✓ Meal updated successfully!")
                 self.editing_meal_id = None
                 self.show_dashboard()
@@ -1193,11 +1740,54 @@ class CalQApp:
             "Confirm Delete", "Are you sure you want to delete this meal entry?"
         ):
             if self.db.delete_meal(meal_id):
+                self._invalidate_meals_cache()
                 messagebox.showinfo("Success", "✓ Meal deleted successfully!")
                 self.show_dashboard()
 
     # -------------------------------------------------------------- All logs
 
+    def _get_meal_groups(self) -> List[Tuple[str, _MealColumns]]:
+        """Return the (date, meals) groups paged in so far, newest first."""
+        if self._meals_cache is None:
+            self._meals_cache = []
+            self._meals_tail = []
+            self._meals_cursor = None
+            self._meals_exhausted = False
+        return self._meals_cache
+
+    def _load_more_meals(self) -> None:
+        """Page the next _LOG_PAGE_SIZE meals into the grouped cache."""
+        groups = self._get_meal_groups()
+        page = self.db.read_all_meals(limit=_LOG_PAGE_SIZE, before=self._meals_cursor)
+        if len(page) < _LOG_PAGE_SIZE:
+            self._meals_exhausted = True
+        if page:
+            last = page[-1]
+            self._meals_cursor = (last["date"], last["timestamp"], last["id"])
+
+        # Rows arrive ordered by date DESC, so each date is one contiguous run
+        new_groups = [
+            (date, list(meals))
+            for date, meals in groupby(
+                self._meals_tail + page, key=itemgetter("date")
+            )
+        ]
+        self._meals_tail = (
+            [] if self._meals_exhausted or not new_groups else new_groups.pop()[1]
+        )
+        groups.extend(
+            (date, _MealColumns.from_rows(meals)) for date, meals in new_groups
+        )
+
+    def _has_more_log_sections(self) -> bool:
+        """True while some date is still unbuilt or unread."""
+        groups = self._get_meal_groups()
+        return self._log_rendered < len(groups) or not self._meals_exhausted
+
+    def _invalidate_meals_cache(self) -> None:
+        """Forget the cached meals; call after any create/update/delete."""
+        self._meals_cache = None
+
     def show_all_logs(self) -> None:
         """Display all meal logs with modern design."""
         self.clear_main_container()
@@ -1209,17 +1799,18 @@ class CalQApp:
         )
         scrollable_frame = tk.Frame(canvas, bg="#f5f7fa")
 
-        scrollable_frame.bind(
-            "<Configure>",
-            lambda event: canvas.configure(scrollregion=canvas.bbox("all")),
-        )
+        self._bind_scrollregion(canvas, scrollable_frame)
 
         window_id = canvas.create_window((0, 0), window=scrollable_frame, anchor="nw")
         canvas.bind(
             "<Configure>",
             lambda event: canvas.itemconfig(window_id, width=event.width),
         )
-        canvas.configure(yscrollcommand=scrollbar.set)
+        canvas.configure(
+            yscrollcommand=lambda first, last: self._on_logs_scrolled(
+                scrollbar, first, last
+            )
+        )
 
         header_frame = tk.Frame(scrollable_frame, bg="white", relief="flat")
         header_frame.pack(fill="x", padx=20, pady=15)
@@ -1233,7 +1824,7 @@ class CalQApp:
         tk.Label(
             content_header,
             text="📋 All Meal Logs",
-            font=("Segoe UI", 20, "bold"),
+            font=self._font(20, "bold"),
             bg="white",
             fg="#424242",
         ).pack(side="left")
@@ -1244,7 +1835,7 @@ class CalQApp:
             command=self.show_dashboard,
             bg="#757575",
             fg="white",
-            font=("Segoe UI", 11, "bold"),
+            font=self._font(11, "bold"),
             cursor="hand2",
             padx=20,
             pady=8,
@@ -1254,20 +1845,23 @@ class CalQApp:
             activeforeground="white",
         ).pack(side="right")
 
-        all_meals = self.db.read_all_meals()
+        groups = self._get_meal_groups()
+        while not groups and not self._meals_exhausted:
+            # A first page of a single date yields no complete group yet
+            self._load_more_meals()
 
-        if not all_meals:
+        if not groups:
             empty_frame = tk.Frame(scrollable_frame, bg="white")
             empty_frame.pack(fill="both", expand=True, padx=20, pady=50)
 
             tk.Label(
-                empty_frame, text="📭", font=("Segoe UI", 64), bg="white"
+                empty_frame, text="📭", font=self._font(64), bg="white"
             ).pack(pady=20)
 
             tk.Label(
                 empty_frame,
                 text="No meals logged yet",
-                font=("Segoe UI", 18, "bold"),
+                font=self._font(18, "bold"),
                 bg="white",
                 fg="#9e9e9e",
             ).pack()
@@ -1275,27 +1869,63 @@ class CalQApp:
             tk.Label(
                 empty_frame,
                 text="Start your health journey by logging your first meal!",
-                font=("Segoe UI", 12),
+                font=self._font(12),
                 bg="white",
                 fg="#bdbdbd",
             ).pack(pady=(10, 30))
         else:
-            meals_by_date = {}
-            for meal in all_meals:
-                date = meal[1]
-                meals_by_date.setdefault(date, []).append(meal)
-
-            for date in sorted(meals_by_date.keys(), reverse=True):
-                self.create_date_log_section(scrollable_frame, date, meals_by_date[date])
+            self._log_rendered = 0
+            self._log_row_meals = {}
+            self._log_hit_regions = {}
+            self._log_row_spans = {}
+            self._log_row_widths = {}
+            self._log_hovered = None
+            self._log_frame = scrollable_frame
+            self._render_more_log_sections()
 
         canvas.pack(side="left", fill="both", expand=True)
         scrollbar.pack(side="right", fill="y")
 
+    def _on_logs_scrolled(
+        self, scrollbar: ttk.Scrollbar, first: str, last: str
+    ) -> None:
+        """Update the scrollbar and queue more sections near the bottom."""
+        scrollbar.set(first, last)
+        if (
+            float(last) > 0.9
+            and self._log_render_after_id is None
+            and self._has_more_log_sections()
+        ):
+            self._log_render_after_id = self.root.after_idle(
+                self._render_more_log_sections
+            )
+
+    def _render_more_log_sections(self) -> None:
+        """Build the next batch of date sections in the all logs view."""
+        self._log_render_after_id = None
+        groups = self._get_meal_groups()
+        end = self._log_rendered + _LOG_SECTION_BATCH
+        while self._log_rendered < end:
+            if self._log_rendered == len(groups):
+                if self._meals_exhausted:
+                    break
+                self._load_more_meals()
+                continue
+            # Each cached group holds all of its date's meals (a date cut off
+            # by a page boundary waits in _meals_tail), so its total needs
+            # no extra query
+            date, meals = groups[self._log_rendered]
+            self.create_date_log_section(
+                self._log_frame, date, meals, fsum(meals.calories)
+            )
+            self._log_rendered += 1
+
     def create_date_log_section(
         self,
         parent: tk.Frame,
         date: str,
-        meals: List[Tuple],
+        meals: _MealColumns,
+        total_calories: float,
     ) -> None:
         """Create log section for specific date with modern design."""
         section_frame = tk.Frame(parent, bg="white", relief="flat", bd=0)
@@ -1304,9 +1934,7 @@ class CalQApp:
         shadow = tk.Frame(section_frame, bg="#e0e0e0", height=2)
         shadow.pack(side="bottom", fill="x")
 
-        total_calories = sum(meal[4] for meal in meals)
-        date_obj = datetime.strptime(date, "%Y-%m-%d")
-        formatted_date = date_obj.strftime("%A, %B %d, %Y")
+        formatted_date = _format_log_date(date)
 
         header_frame = tk.Frame(section_frame, bg="#f5f5f5")
         header_frame.pack(fill="x", padx=0, pady=0)
@@ -1317,7 +1945,7 @@ class CalQApp:
         tk.Label(
             header_content,
             text=f"📅 {formatted_date}",
-            font=("Segoe UI", 15, "bold"),
+            font=self._font(15, "bold"),
             bg="#f5f5f5",
             fg="#424242",
         ).pack(side="left")
@@ -1328,147 +1956,213 @@ class CalQApp:
         tk.Label(
             cal_badge,
             text=f"{int(total_calories)} calories",
-            font=("Segoe UI", 13, "bold"),
+            font=self._font(13, "bold"),
             bg="#e8f5e9",
             fg="#2e7d32",
         ).pack()
 
-        for meal in meals:
-            meal_id, _, meal_type, food_name, calories, serving_size, notes, _ = meal
-
-            meal_frame = tk.Frame(section_frame, bg="white", relief="flat", bd=0)
-            meal_frame.pack(fill="x", padx=20, pady=5)
-
-            meal_colors = {
-                "Breakfast": "#ff9800",
-                "Lunch": "#4caf50",
-                "Dinner": "#2196f3",
-                "Snacks": "#9c27b0",
-            }
-
-            border = tk.Frame(
-                meal_frame, bg=meal_colors.get(meal_type, "#757575"), width=5
+        # Meal rows are drawn on one canvas per date instead of a widget tree
+        # per meal; Edit/Delete are hit regions handled by one click binding.
+        # Row heights depend on how the text wraps at the canvas width, so
+        # this is only a starting height; _draw_log_rows sets the real one.
+        height = (_LOG_ROW_MIN_HEIGHT + _LOG_ROW_GAP) * len(meals)
+        rows_canvas = tk.Canvas(
+            section_frame, bg="white", highlightthickness=0, height=height
+        )
+        rows_canvas.pack(fill="x", padx=20, pady=(5, 10))
+        self._log_row_meals[str(rows_canvas)] = meals
+        rows_canvas.bind("<Configure>", self._on_log_rows_configure)
+        rows_canvas.bind("<Button-1>", self._on_log_rows_click)
+        rows_canvas.bind("<Motion>", self._on_log_rows_motion)
+        rows_canvas.bind("<Leave>", self._on_log_rows_leave)
+
+    def _draw_log_rows(
+        self, canvas: tk.Canvas, meals: _MealColumns, width: int
+    ) -> None:
+        """
+        (Re)draw a date section's meal rows at the given canvas width.
+
+        Food name, serving size and notes wrap between the meal type badge
+        and the calorie badge; each row is as tall as its wrapped text, and
+        the canvas is resized to fit all rows.
+        """
+        canvas.delete("all")
+        regions: List[_HitRegion] = []
+        spans: List[Tuple[int, int, int]] = []
+        top = _LOG_ROW_GAP // 2
+        for meal_id, meal_type, food_name, calories, serving_size, notes in zip(
+            meals.ids,
+            meals.meal_types,
+            meals.food_names,
+            meals.calories,
+            meals.serving_sizes,
+            meals.notes,
+        ):
+            # Horizontal layout first: badges are measured at y=0 and moved
+            # to the row's middle once its height is known.
+            badge_text = canvas.create_text(
+                30,
+                0,
+                text="%s %s" % (_MEAL_ICONS.get(meal_type, "🍴"), meal_type),
+                anchor="w",
+                font=self._font(9, "bold"),
+                fill=_BADGE_TEXT_COLORS.get(meal_type, "#424242"),
             )
-            border.pack(side="left", fill="y")
-
-            content_frame = tk.Frame(meal_frame, bg="white")
-            content_frame.pack(side="left", fill="both", expand=True, padx=15, pady=12)
-
-            badge_colors = {
-                "Breakfast": "#fff3e0",
-                "Lunch": "#e8f5e9",
-                "Dinner": "#e3f2fd",
-                "Snacks": "#f3e5f5",
-            }
-            badge_text_colors = {
-                "Breakfast": "#e65100",
-                "Lunch": "#1b5e20",
-                "Dinner": "#0d47a1",
-                "Snacks": "#4a148c",
-            }
-
-            badge_frame = tk.Frame(
-                content_frame,
-                bg=badge_colors.get(meal_type, "#f5f5f5"),
-                padx=10,
-                pady=4,
+            text_x = canvas.bbox(badge_text)[2] + 22
+
+            # Right-hand side, laid out right to left. Only the action areas
+            # are reserved here; their buttons are drawn while the row is
+            # hovered (see _show_log_row_actions).
+            right = width - 15
+            action_spans = []
+            for action, _label, _color in _LOG_ROW_ACTIONS:
+                left = right - _LOG_BUTTON_WIDTH
+                action_spans.append((left, right, action))
+                right = left - 8
+
+            cal_text = canvas.create_text(
+                right - 14,
+                0,
+                text="%d cal" % calories,
+                anchor="e",
+                font=self._font(11, "bold"),
+                fill="#2e7d32",
             )
-            badge_frame.pack(side="left", padx=(0, 12))
-
-            meal_icons = {
-                "Breakfast": "🌅",
-                "Lunch": "🌞",
-                "Dinner": "🌙",
-                "Snacks": "🍿",
-            }
-
-            tk.Label(
-                badge_frame,
-                text=f"{meal_icons.get(meal_type, '🍴')} {meal_type}",
-                font=("Segoe UI", 9, "bold"),
-                bg=badge_colors.get(meal_type, "#f5f5f5"),
-                fg=badge_text_colors.get(meal_type, "#424242"),
-            ).pack()
-
-            details_frame = tk.Frame(content_frame, bg="white")
-            details_frame.pack(side="left", fill="both", expand=True)
-
-            tk.Label(
-                details_frame,
-                text=food_name,
-                font=("Segoe UI", 12, "bold"),
-                bg="white",
-                fg="#212121",
-                anchor="w",
-            ).pack(fill="x")
+            # Text stops short of the calorie badge (12px padding + 10px gap)
+            text_width = max(canvas.bbox(cal_text)[0] - 22 - text_x, 60)
 
+            text_y = top + 12
+            lines = [(food_name, self._font(12, "bold"), "#212121")]
             if serving_size:
-                tk.Label(
-                    details_frame,
-                    text=f"📏 {serving_size}",
-                    font=("Segoe UI", 10),
-                    bg="white",
-                    fg="#757575",
-                    anchor="w",
-                ).pack(fill="x", pady=(2, 0))
-
+                lines.append(("📏 %s" % serving_size, self._font(10), "#757575"))
             if notes:
-                tk.Label(
-                    details_frame,
-                    text=f"💭 {notes}",
-                    font=("Segoe UI", 10, "italic"),
-                    bg="white",
-                    fg="#9e9e9e",
-                    anchor="w",
-                ).pack(fill="x", pady=(2, 0))
+                lines.append(("💭 %s" % notes, self._font(10, "italic"), "#9e9e9e"))
+            for text, font, color in lines:
+                item = canvas.create_text(
+                    text_x,
+                    text_y,
+                    text=text,
+                    anchor="nw",
+                    width=text_width,
+                    font=font,
+                    fill=color,
+                )
+                text_y = canvas.bbox(item)[3] + 2
 
-            actions_frame = tk.Frame(meal_frame, bg="white")
-            actions_frame.pack(side="right", padx=15, pady=12)
+            bottom = max(top + _LOG_ROW_MIN_HEIGHT, text_y + 10)
+            middle = (top + bottom) // 2
 
-            cal_display = tk.Frame(actions_frame, bg="#e8f5e9", padx=12, pady=6)
-            cal_display.pack(side="left", padx=(0, 10))
+            canvas.create_rectangle(
+                0, top, 5, bottom, fill=_MEAL_COLORS.get(meal_type, "#757575"), width=0
+            )
 
-            tk.Label(
-                cal_display,
-                text=f"{int(calories)} cal",
-                font=("Segoe UI", 11, "bold"),
-                bg="#e8f5e9",
-                fg="#2e7d32",
-            ).pack()
+            canvas.move(badge_text, 0, middle)
+            x0, y0, x1, y1 = canvas.bbox(badge_text)
+            badge = canvas.create_rectangle(
+                x0 - 10,
+                y0 - 4,
+                x1 + 10,
+                y1 + 4,
+                fill=_BADGE_COLORS.get(meal_type, "#f5f5f5"),
+                width=0,
+            )
+            canvas.tag_lower(badge, badge_text)
 
-            tk.Button(
-                actions_frame,
-                text="✏️ Edit",
-                command=(lambda m_id=meal_id: self.edit_meal(m_id)),
-                bg="#2196f3",
-                fg="white",
-                font=("Segoe UI", 10, "bold"),
-                cursor="hand2",
-                padx=12,
-                pady=5,
-                width=10,
-                relief="flat",
-                bd=0,
-                activebackground="#1976d2",
-                activeforeground="white",
-            ).pack(side="left", padx=4)
-
-            tk.Button(
-                actions_frame,
-                text="🗑️ Delete",
-                command=(lambda m_id=meal_id: self.delete_meal_confirm(m_id)),
-                bg="#f44336",
-                fg="white",
-                font=("Segoe UI", 10, "bold"),
-                cursor="hand2",
-                padx=12,
-                pady=5,
-                width=10,
-                relief="flat",
-                bd=0,
-                activebackground="#d32f2f",
-                activeforeground="white",
-            ).pack(side="left", padx=4)
+            canvas.move(cal_text, 0, middle)
+            x0, y0, x1, y1 = canvas.bbox(cal_text)
+            cal_badge = canvas.create_rectangle(
+                x0 - 12, y0 - 6, x1 + 12, y1 + 6, fill="#e8f5e9", width=0
+            )
+            canvas.tag_lower(cal_badge, cal_text)
+
+            for left, right, action in action_spans:
+                bbox = (left, middle - 15, right, middle + 15)
+                regions.append((bbox, meal_id, action))
+
+            spans.append((top, bottom, meal_id))
+            top = bottom + _LOG_ROW_GAP
+
+        path = str(canvas)
+        self._log_hit_regions[path] = regions
+        self._log_row_spans[path] = spans
+        self._log_row_widths[path] = width
+        if self._log_hovered is not None and self._log_hovered[0] == path:
+            self._log_hovered = None
+        # The height change fires <Configure> again; the width is unchanged,
+        # so _on_log_rows_configure doesn't redraw
+        canvas.configure(height=top - _LOG_ROW_GAP // 2)
+
+    def _on_log_rows_configure(self, event: tk.Event) -> None:
+        """Redraw a rows canvas for its new width."""
+        path = str(event.widget)
+        meals = self._log_row_meals.get(path)
+        if meals is not None and self._log_row_widths.get(path) != event.width:
+            self._draw_log_rows(event.widget, meals, event.width)
+
+    def _log_hit_test(self, event: tk.Event) -> Optional[Tuple[int, str]]:
+        """Return (meal_id, action) for the action under the pointer, if any."""
+        x, y = event.x, event.y
+        for (x0, y0, x1, y1), meal_id, action in self._log_hit_regions.get(
+            str(event.widget), ()
+        ):
+            if x0 <= x <= x1 and y0 <= y <= y1:
+                return meal_id, action
+        return None
+
+    def _on_log_rows_click(self, event: tk.Event) -> None:
+        """Dispatch a click on a meal row's Edit or Delete action."""
+        hit = self._log_hit_test(event)
+        if hit is None:
+            return
+        meal_id, action = hit
+        if action == "edit":
+            self.edit_meal(meal_id)
+        else:
+            self.delete_meal_confirm(meal_id)
+
+    def _on_log_rows_motion(self, event: tk.Event) -> None:
+        """Show the hovered row's actions and the hand cursor over them."""
+        canvas = event.widget
+        path = str(canvas)
+        hovered = None
+        for top, bottom, meal_id in self._log_row_spans.get(path, ()):
+            if top <= event.y <= bottom:
+                hovered = (path, meal_id)
+                break
+        if hovered != self._log_hovered:
+            self._show_log_row_actions(canvas, hovered)
+
+        cursor = "hand2" if self._log_hit_test(event) else ""
+        if canvas.cget("cursor") != cursor:
+            canvas.configure(cursor=cursor)
+
+    def _on_log_rows_leave(self, event: tk.Event) -> None:
+        """Hide the row actions when the pointer leaves a rows canvas."""
+        self._show_log_row_actions(event.widget, None)
+
+    def _show_log_row_actions(
+        self, canvas: tk.Canvas, hovered: Optional[Tuple[str, int]]
+    ) -> None:
+        """Draw the Edit/Delete buttons for the hovered row only."""
+        canvas.delete("row_actions")
+        self._log_hovered = hovered
+        if hovered is None:
+            return
+        hovered_id = hovered[1]
+        for bbox, meal_id, action in self._log_hit_regions.get(hovered[0], ()):
+            if meal_id != hovered_id:
+                continue
+            label, color = _LOG_ACTION_STYLES[action]
+            x0, y0, x1, y1 = bbox
+            canvas.create_rectangle(*bbox, fill=color, width=0, tags="row_actions")
+            canvas.create_text(
+                (x0 + x1) // 2,
+                (y0 + y1) // 2,
+                text=label,
+                font=self._font(10, "bold"),
+                fill="white",
+                tags="row_actions",
+            )
 
     # --------------------------------------------------------------- Lifecycle
 